@@ -3,34 +3,146 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from .base import BaseAgent
-from ..core.tools import execute_tool
+from ..core.tools import aexecute_tool, execute_tool
+from ..core.history import History
 from ..core.memory import MemoryStore
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+# Intent keywords are matched as plain substrings; each list is compiled into a
+# single alternation so a check is one regex pass instead of a Python loop.
+_TOOL_KEYWORDS = frozenset({
+    "how",
+    "plan",
+    "steps",
+    "action",
+    "strategy",
+    "research",
+    "find",
+    "search",
+    "calculate",
+    "current",
+    "information about",
+    "tell me about",
+    "find out",
+    "explain",
+})
+_SEARCH_KEYWORDS = frozenset({
+    "search",
+    "look up",
+    "find",
+    "google",
+    "browse",
+    "research",
+    "information about",
+    "tell me about",
+    "find out",
+    "explain",
+})
+_CURRENT_KEYWORDS = frozenset({"current", "today", "now", "date", "time"})
+_QUESTION_WORDS = ("what", "who", "where", "when", "why", "how")
+
+
+def _keyword_regex(*keyword_sets: Iterable[str]) -> re.Pattern:
+    keywords = sorted({kw for kws in keyword_sets for kw in kws})
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_TOOL_KW_RE = _keyword_regex(_TOOL_KEYWORDS, _SEARCH_KEYWORDS)
+_SEARCH_KW_RE = _keyword_regex(_SEARCH_KEYWORDS)
+_INTENT_KW_RE = _keyword_regex(_SEARCH_KEYWORDS, _CURRENT_KEYWORDS)
+_MATH_RE = re.compile(r"\d+[\+\-\*/%]")  # quick math heuristic
+_MATH_EXPR_RE = re.compile(r"\d+[\+\-\*/%\(\)]\d+")
+_EXPR_RE = re.compile(r"[\d(][\d\+\-\*/%\(\)\.\s]*")
+_SENT_TRANS = str.maketrans({"!": ".", "?": "."})
+_QUESTION_PREFIXES = ("what", "who", "where", "when", "why", "how", "is", "are", "can")
+_HAS_DIGIT = re.compile(r"\d").search
 
-class AristotleAgent(BaseAgent):
-    """Practical agent that can invoke tools for actionable guidance."""
 
-    _KEYWORDS = [
-        "how",
-        "plan",
-        "steps",
-        "action",
-        "strategy",
-        "research",
-        "find",
-        "search",
-        "calculate",
-        "current",
-        "information about",
-        "tell me about",
-        "find out",
-        "explain",
+def _build_intent_automaton() -> Optional[Any]:
+    """Aho-Corasick automaton mapping every intent keyword to its tool."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _CURRENT_KEYWORDS:
+        automaton.add_word(keyword, "get_current_info")
+    for keyword in _SEARCH_KEYWORDS:
+        automaton.add_word(keyword, "web_search")
+    automaton.make_automaton()
+    return automaton
+
+
+_INTENT_AUTOMATON = _build_intent_automaton()
+
+
+def _keyword_intent(text: str) -> Optional[str]:
+    """Tool implied by intent keywords; search keywords win over date/time ones."""
+    if _INTENT_AUTOMATON is not None:
+        found = None
+        for _, tool in _INTENT_AUTOMATON.iter(text):
+            if tool == "web_search":
+                return tool
+            found = tool
+        return found
+
+    if not _INTENT_KW_RE.search(text):
+        return None
+    return "web_search" if _SEARCH_KW_RE.search(text) else "get_current_info"
+
+
+# Intent detection is pure string work that repeats across rounds and retries
+# for the same prompt, so it is memoized on the (lowercased) text.
+@lru_cache(maxsize=1024)
+def _has_tool_intent(text: str) -> bool:
+    return bool(_TOOL_KW_RE.search(text) or _MATH_RE.search(text))
+
+
+@lru_cache(maxsize=1024)
+def _detect_tool(text: str) -> Optional[str]:
+    has_digit = bool(_HAS_DIGIT(text))
+
+    # Math first to catch explicit expressions
+    if has_digit and _MATH_EXPR_RE.search(text):
+        return "calculate"
+
+    # Web search, then current info (date / time), in a single keyword pass
+    intent = _keyword_intent(text)
+    if intent is not None:
+        return intent
+
+    # Fallback: if numbers present, treat as math; if question words, search
+    if has_digit:
+        return "calculate"
+    if text.startswith(_QUESTION_WORDS):
+        return "web_search"
+
+    return None
+
+
+@lru_cache(maxsize=512)
+def _extract_question(text: str) -> str:
+    sentences = text.translate(_SENT_TRANS).split(".")
+    questions = [
+        s.strip()
+        for s in sentences
+        if s.strip().lower().startswith(_QUESTION_PREFIXES)
     ]
+    if questions:
+        return questions[0]
+    return sentences[-1].strip() if sentences else text.strip()
+
+
+class AristotleAgent(BaseAgent):
+    """Practical agent that can invoke tools for actionable guidance."""
 
     def get_system_prompt(self) -> str:
         prompt = (
@@ -42,116 +154,116 @@ class AristotleAgent(BaseAgent):
             prompt += " You may rely on external information you gathered via tools."
         return prompt
 
-    def _should_use_tools(self, question: str, history: List[Dict[str, Any]]) -> bool:
+    def _should_use_tools(self, prompt_lower: str, history: List[Dict[str, Any]]) -> bool:
         # Prefer the most recent user turn for intent signals
-        recent_user = next(
-            (
-                turn.get("content", "")
-                for turn in reversed(history)
-                if str(turn.get("speaker", "")).lower() == "user"
-            ),
-            question,
-        )
-        text = str(recent_user).lower()
-        math_pattern = r"\d+[\+\-\*\/%]"  # quick math heuristic
-        return any(kw in text for kw in self._KEYWORDS) or bool(re.search(math_pattern, text))
+        if isinstance(history, History):
+            recent_user = history.last_user
+        else:
+            recent_user = next(
+                (turn for turn in reversed(history) if str(turn.get("speaker", "")).lower() == "user"),
+                None,
+            )
+        if recent_user is None:
+            return _has_tool_intent(prompt_lower)
+        return _has_tool_intent(str(recent_user.get("content", "")).lower())
 
     def _detect_tool_needed(self, prompt: str) -> Optional[str]:
         if not getattr(self.config, "tools_enabled", False):
             return None
 
-        text = prompt.lower()
-
-        # Math first to catch explicit expressions
-        if re.search(r"\d+[\+\-\*\/%\(\)]\d+", text):
-            return "calculate"
-
-        # Web search intents
-        if any(
-            k in text
-            for k in [
-                "search",
-                "look up",
-                "find",
-                "google",
-                "browse",
-                "research",
-                "information about",
-                "tell me about",
-                "find out",
-                "explain",
-            ]
-        ):
-            return "web_search"
-
-        # Current info (date / time)
-        if any(k in text for k in ["current", "today", "now", "date", "time"]):
-            return "get_current_info"
-
-        # Fallback: if numbers present, treat as math; if question words, search
-        if any(ch.isdigit() for ch in text):
-            return "calculate"
-        if any(text.startswith(qw) for qw in ("what", "who", "where", "when", "why", "how")):
-            return "web_search"
-
-        return None
+        return _detect_tool(prompt.lower())
 
     def _extract_question_from_response(self, text: str) -> str:
-        sentences = re.split(r"[.!?]+", text)
-        questions = [
-            s.strip()
-            for s in sentences
-            if s.strip().lower().startswith(
-                ("what", "who", "where", "when", "why", "how", "is", "are", "can")
+        return _extract_question(text)
+
+    def _plan_tool_call(self, user_prompt: str, history: List[Dict[str, Any]]) -> Optional[Tuple[str, str]]:
+        """Return the ``(tool, query)`` to run for this prompt, if any."""
+        prompt_lower = user_prompt.lower()
+        if not (self.config.tools_enabled and self._should_use_tools(prompt_lower, history)):
+            return None
+        tool = _detect_tool(prompt_lower)
+        if not tool:
+            return None
+
+        query = self._extract_question_from_response(user_prompt)
+
+        # Normalize query for specific tools
+        if tool == "calculate":
+            expr = _EXPR_RE.search(user_prompt)
+            if expr:
+                query = expr.group().strip()
+        elif tool == "get_current_info":
+            if "time" in prompt_lower:
+                query = "time"
+            elif "date" in prompt_lower or "today" in prompt_lower:
+                query = "date"
+            else:
+                query = "datetime"
+        return tool, query
+
+    def _tool_context(
+        self,
+        tool: str,
+        tool_result: Any,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+    ) -> str:
+        # Normalize list outputs for prompt readability
+        if isinstance(tool_result, list):
+            tool_result = "\n".join(str(item) for item in tool_result)
+        if memory is not None:
+            memory.add_entry(
+                key=f"tool_{tool}_{len(history)}",
+                value=tool_result,
+                source=self.name,
             )
-        ]
-        if questions:
-            return questions[0]
-        return sentences[-1].strip() if sentences else text.strip()
+        # Kept out of the question so the shared prompt prefix stays cacheable
+        return (
+            f"[Tool {tool} Result]: {tool_result}\n"
+            "Use this information to craft a practical recommendation."
+        )
 
-    def generate_response(
+    def prepare_prompt(
         self,
         user_prompt: str,
         history: List[Dict[str, Any]],
         memory: Optional[MemoryStore] = None,
-        **generation_kwargs: Any,
+    ) -> Tuple[str, bool]:
+        tool_context: Optional[str] = None
+        plan = self._plan_tool_call(user_prompt, history)
+        if plan:
+            tool, query = plan
+            tool_context = self._tool_context(tool, execute_tool(tool, query), history, memory)
+        prompt = self.build_prompt(user_prompt, history, memory, extra_context=tool_context)
+        return prompt, tool_context is not None
+
+    async def aprepare_prompt(
+        self,
+        user_prompt: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+    ) -> Tuple[str, bool]:
+        # The tool call is awaited rather than blocking the event loop, so the
+        # other agents' generations in the round keep running meanwhile.
+        tool_context: Optional[str] = None
+        plan = self._plan_tool_call(user_prompt, history)
+        if plan:
+            tool, query = plan
+            tool_result = await aexecute_tool(tool, query)
+            tool_context = self._tool_context(tool, tool_result, history, memory)
+        prompt = self.build_prompt(user_prompt, history, memory, extra_context=tool_context)
+        return prompt, tool_context is not None
+
+    def finalize_response(
+        self,
+        raw_output: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+        used_tool: bool = False,
     ) -> str:
-        if self.config.tools_enabled and self._should_use_tools(user_prompt, history):
-            tool = self._detect_tool_needed(user_prompt)
-            if tool:
-                query = self._extract_question_from_response(user_prompt)
-
-                # Normalize query for specific tools
-                if tool == "calculate":
-                    expr = re.search(r"[\d\+\-\*\/%\(\)\.\s]+", user_prompt)
-                    if expr:
-                        query = expr.group().strip()
-                elif tool == "get_current_info":
-                    if "time" in user_prompt.lower():
-                        query = "time"
-                    elif "date" in user_prompt.lower() or "today" in user_prompt.lower():
-                        query = "date"
-                    else:
-                        query = "datetime"
-
-                tool_result = execute_tool(tool, query)
-                # Normalize list outputs for prompt readability
-                if isinstance(tool_result, list):
-                    tool_result = "\n".join(str(item) for item in tool_result)
-                if memory is not None:
-                    memory.add_entry(
-                        key=f"tool_{tool}_{len(history)}",
-                        value=tool_result,
-                        source=self.name,
-                    )
-                enhanced_prompt = (
-                    f"{user_prompt}\n\n[Tool {tool} Result]: {tool_result}\n"
-                    "Use this information to craft a practical recommendation."
-                )
-                return super().generate_response(enhanced_prompt, history, memory, **generation_kwargs)
-
-        response = super().generate_response(user_prompt, history, memory, **generation_kwargs)
-        if memory is not None and response:
+        response = super().finalize_response(raw_output, history, memory, used_tool)
+        # Tool-assisted replies restate the tool result; only own reasoning is an insight
+        if memory is not None and response and not used_tool:
             memory.add_entry(
                 key=f"aristotle_insight_{len(history)}",
                 value=response,
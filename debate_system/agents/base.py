@@ -3,14 +3,18 @@ from __future__ import annotations
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from ..core.config import AgentConfig
+from ..core.history import History, format_turn
 from ..core.memory import MemoryStore
-from ..inference.manager import generate_text
+from ..inference.manager import agenerate_text, generate_text, generate_text_stream
 
 logger = logging.getLogger(__name__)
 
+_EMPTY_HISTORY = "(No prior conversation)"
+
 
 class BaseAgent(ABC):
     """Abstract base class for philosopher agents."""
@@ -25,18 +29,16 @@ class BaseAgent(ABC):
     def get_system_prompt(self) -> str:
         """Persona-specific system prompt."""
 
+    @cached_property
+    def system_prompt(self) -> str:
+        """``get_system_prompt()`` computed once; personas do not change mid-debate."""
+        return self.get_system_prompt()
+
     def format_history(self, history: List[Dict[str, Any]]) -> str:
-        if not history:
-            return "(No prior conversation)"
-
-        lines = []
-        for turn in history:
-            speaker = turn.get("speaker") or turn.get("agent") or "Unknown"
-            content = turn.get("content") or turn.get("response") or ""
-            content = str(content).strip()
-            if content:
-                lines.append(f"[{speaker}] {content}")
-        return "\n".join(lines) if lines else "(No prior conversation)"
+        if isinstance(history, History):
+            return history.render() or _EMPTY_HISTORY
+        lines = (line for line in map(format_turn, history) if line is not None)
+        return "\n".join(lines) or _EMPTY_HISTORY
 
     def format_memory(self, memory: Optional[MemoryStore], limit: int = 5) -> str:
         if memory is None:
@@ -48,12 +50,21 @@ class BaseAgent(ABC):
         user_prompt: str,
         history: List[Dict[str, Any]],
         memory: Optional[MemoryStore] = None,
+        extra_context: Optional[str] = None,
     ) -> str:
+        # Question and history come first: they are identical for every agent in
+        # a turn and only grow at the end, so backends with prefix caching
+        # (Ollama/llama.cpp, vLLM) reuse their KV state instead of re-prefilling.
+        # Everything persona- or turn-specific goes after that shared prefix.
         parts = [
-            self.get_system_prompt(),
+            "## Current Question:",
+            user_prompt,
             "",
             "## Conversation History:",
             self.format_history(history),
+            "",
+            "## Your Role:",
+            self.system_prompt,
         ]
 
         if memory:
@@ -63,10 +74,13 @@ class BaseAgent(ABC):
                 self.format_memory(memory),
             ])
 
+        if extra_context:
+            parts.extend([
+                "",
+                extra_context,
+            ])
+
         parts.extend([
-            "",
-            "## Current Question:",
-            user_prompt,
             "",
             f"## Your Response as {self.name}:",
             f"{self.name}:",
@@ -76,34 +90,115 @@ class BaseAgent(ABC):
 
     def extract_response(self, raw_output: str) -> str:
         """Extract the agent's core response from raw model output."""
-        response = raw_output.strip()
-        
-        # Remove common speaker prefixes
-        prefixes = [f"{self.name}:", f"[{self.name}]"]
-        for prefix in prefixes:
-            if response.lower().startswith(prefix.lower()):
-                response = response[len(prefix):].strip()
-                break
-
-        # Return the response, preserving newlines
-        return response.strip()
+        # Remove common speaker prefixes, preserving newlines in the response
+        return raw_output[self._reply_start(raw_output):].strip()
 
-    def generate_response(
+    def _speaker_prefixes(self) -> List[str]:
+        return [f"{self.name}:", f"[{self.name}]"]
+
+    def _reply_start(self, raw_output: str) -> int:
+        """Offset in ``raw_output`` just past leading whitespace and any speaker prefix."""
+        start = len(raw_output) - len(raw_output.lstrip())
+        for prefix in self._speaker_prefixes():
+            if raw_output[start:start + len(prefix)].lower() == prefix.lower():
+                return start + len(prefix)
+        return start
+
+    def prepare_prompt(
         self,
         user_prompt: str,
         history: List[Dict[str, Any]],
         memory: Optional[MemoryStore] = None,
-        **generation_kwargs: Any,
-    ) -> str:
-        prompt = self.build_prompt(user_prompt, history, memory)
+    ) -> Tuple[str, bool]:
+        """Return the prompt for this turn and whether a tool result was attached."""
+        return self.build_prompt(user_prompt, history, memory), False
+
+    async def aprepare_prompt(
+        self,
+        user_prompt: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+    ) -> Tuple[str, bool]:
+        """Async ``prepare_prompt`` for agents that do I/O while building the prompt."""
+        return self.prepare_prompt(user_prompt, history, memory)
+
+    def generation_params(self, **generation_kwargs: Any) -> Dict[str, Any]:
         params = {
             "temperature": self.config.temperature,
             "max_new_tokens": self.config.max_tokens,
         }
         params.update(generation_kwargs)
+        return params
 
-        logger.debug(f"{self.name} generating with params: {params}")
-        raw = generate_text(prompt, **params)
-        response = self.extract_response(raw)
+    def finalize_response(
+        self,
+        raw_output: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+        used_tool: bool = False,
+    ) -> str:
+        """Turn raw model output into the agent's reply.
+
+        ``used_tool`` is the flag returned by ``prepare_prompt`` for this turn.
+        """
+        response = self.extract_response(raw_output)
         logger.info(f"{self.name} responded:\n{response}")
         return response
+
+    def generate_response(
+        self,
+        user_prompt: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+        **generation_kwargs: Any,
+    ) -> str:
+        prompt, used_tool = self.prepare_prompt(user_prompt, history, memory)
+        params = self.generation_params(**generation_kwargs)
+
+        logger.debug(f"{self.name} generating with params: {params}")
+        raw = generate_text(prompt, **params)
+        return self.finalize_response(raw, history, memory, used_tool)
+
+    async def agenerate_response(
+        self,
+        user_prompt: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+        **generation_kwargs: Any,
+    ) -> str:
+        """Async counterpart of ``generate_response``."""
+        prompt, used_tool = await self.aprepare_prompt(user_prompt, history, memory)
+        params = self.generation_params(**generation_kwargs)
+
+        logger.debug(f"{self.name} generating with params: {params}")
+        raw = await agenerate_text(prompt, **params)
+        return self.finalize_response(raw, history, memory, used_tool)
+
+    def stream_response(
+        self,
+        user_prompt: str,
+        history: List[Dict[str, Any]],
+        memory: Optional[MemoryStore] = None,
+        **generation_kwargs: Any,
+    ) -> Iterator[str]:
+        """Yield the reply text generated so far as tokens arrive.
+
+        The final item is the finished response, as returned by
+        ``generate_response``.
+        """
+        prompt, used_tool = self.prepare_prompt(user_prompt, history, memory)
+        params = self.generation_params(**generation_kwargs)
+
+        logger.debug(f"{self.name} streaming with params: {params}")
+        probe = max(len(prefix) for prefix in self._speaker_prefixes())
+        raw = ""
+        start: Optional[int] = None
+        for chunk in generate_text_stream(prompt, **params):
+            raw += chunk
+            if start is None:
+                # Wait until a speaker prefix can be recognized, then strip it once
+                if len(raw.lstrip()) < probe:
+                    continue
+                start = self._reply_start(raw)
+            yield raw[start:].strip()
+        yield self.finalize_response(raw, history, memory, used_tool)
@@ -21,17 +21,24 @@ class SummaryAgent(BaseAgent):
         user_prompt: str,
         history: List[Dict[str, Any]],
         memory: Optional[MemoryStore] = None,
+        extra_context: Optional[str] = None,
     ) -> str:
+        # Same shared question/history prefix as the debate turns (see BaseAgent)
         parts = [
-            self.get_system_prompt(),
-            "",
             "## Original Question:",
             user_prompt,
             "",
             "## Full Conversation:",
             self.format_history(history),
+            "",
+            "## Your Role:",
+            self.system_prompt,
+        ]
+        if extra_context:
+            parts.extend(["", extra_context])
+        parts.extend([
             "",
             f"## Your Response as {self.name}:",
             f"{self.name}:",
-        ]
+        ])
         return "\n".join(parts)
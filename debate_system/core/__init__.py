@@ -9,8 +9,9 @@ from .config import (
 	OrchestratorConfig,
 	ToolConfig,
 )
+from .history import History
 from .memory import MemoryStore, MemoryEntry
-from .tools import execute_tool, list_tools
+from .tools import aexecute_tool, execute_tool, list_tools
 
 def __getattr__(name):
     if name in {"DebateOrchestrator", "build_orchestrator"}:
@@ -26,8 +27,10 @@ __all__ = [
 	"ModelConfig",
 	"OrchestratorConfig",
 	"ToolConfig",
+	"History",
 	"MemoryStore",
 	"MemoryEntry",
+	"aexecute_tool",
 	"execute_tool",
 	"list_tools",
 	"DebateOrchestrator",
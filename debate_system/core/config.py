@@ -7,6 +7,9 @@ from typing import Any, Dict, Optional
 import os
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it; same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class AgentConfig:
@@ -28,6 +31,8 @@ class ModelConfig:
     timeout: int = 30
     quantization: Optional[str] = None
     device: str = "auto"
+    cache_size: int = 256
+    cache_sampled: bool = False
 
 
 @dataclass
@@ -37,6 +42,8 @@ class MemoryConfig:
     persist_path: str
     auto_save: bool = True
     max_entries: int = 1000
+    save_interval: int = 16
+    compact_every: int = 1000
 
 
 @dataclass
@@ -48,6 +55,8 @@ class OrchestratorConfig:
     random_seed: Optional[int] = None
     max_retries: int = 3
     random_order: bool = True
+    parallel_agents: bool = False
+    max_concurrency: int = 3
 
 
 @dataclass
@@ -88,44 +97,63 @@ class ConfigManager:
         self._personas = self._load_yaml(self.personas_path)
         self._tools = self._load_yaml(self.tools_path)
 
+        # Parsed config objects, built on first request
+        self._agent_configs: Dict[str, AgentConfig] = {}
+        self._tool_configs: Dict[str, ToolConfig] = {}
+        self._model_config: Optional[ModelConfig] = None
+
     def _load_yaml(self, path: Path) -> Dict[str, Any]:
         if not path.exists():
             raise FileNotFoundError(f"Config file not found: {path}")
 
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
         return data
 
     def get_agent_config(self, key: str) -> AgentConfig:
+        cached = self._agent_configs.get(key)
+        if cached is not None:
+            return cached
+
         data = self._personas.get(key)
         if data is None:
             raise KeyError(f"Agent config '{key}' not found")
 
-        return AgentConfig(
+        config = AgentConfig(
             name=data.get("name", key.title()),
             instruction=data.get("instruction", ""),
             temperature=float(data.get("temperature", 0.8)),
             max_tokens=int(data.get("max_tokens", 256)),
             tools_enabled=bool(data.get("tools_enabled", False)),
         )
+        self._agent_configs[key] = config
+        return config
 
     def get_model_config(self) -> ModelConfig:
+        if self._model_config is not None:
+            return self._model_config
+
         model = self._settings.get("model", {})
-        return ModelConfig(
+        self._model_config = ModelConfig(
             backend=model.get("backend", "ollama"),
             model_name=model.get("model_name", ""),
             timeout=int(model.get("timeout", 60)),
             quantization=model.get("quantization"),
             device=model.get("device", "auto"),
+            cache_size=int(model.get("cache_size", 256)),
+            cache_sampled=bool(model.get("cache_sampled", False)),
         )
+        return self._model_config
 
     def get_memory_config(self) -> MemoryConfig:
         memory = self._settings.get("memory", {})
         return MemoryConfig(
-            persist_path=memory.get("persist_path", "data/memory.json"),
+            persist_path=memory.get("persist_path", "data/memory.jsonl"),
             auto_save=bool(memory.get("auto_save", True)),
             max_entries=int(memory.get("max_entries", 1000)),
+            save_interval=int(memory.get("save_interval", 16)),
+            compact_every=int(memory.get("compact_every", 1000)),
         )
 
     def get_orchestrator_config(self) -> OrchestratorConfig:
@@ -139,6 +167,8 @@ class ConfigManager:
             random_seed=seed_value,
             max_retries=int(orch.get("max_retries", 2)),
             random_order=bool(orch.get("random_order", True)),
+            parallel_agents=bool(orch.get("parallel_agents", False)),
+            max_concurrency=int(orch.get("max_concurrency", 3)),
         )
 
     def get_logging_config(self) -> LoggingConfig:
@@ -150,13 +180,19 @@ class ConfigManager:
         )
 
     def get_tool_config(self, tool_name: str) -> ToolConfig:
+        cached = self._tool_configs.get(tool_name)
+        if cached is not None:
+            return cached
+
         tool_data = self._tools.get(tool_name, {})
-        return ToolConfig(
+        config = ToolConfig(
             enabled=bool(tool_data.get("enabled", True)),
             timeout=int(tool_data.get("timeout", 10)),
             max_results=int(tool_data.get("max_results", 5)),
             cache_results=bool(tool_data.get("cache_results", False)),
         )
+        self._tool_configs[tool_name] = config
+        return config
 
     def get_all_tool_configs(self) -> Dict[str, ToolConfig]:
-        return {name: self.get_tool_config(name) for name in self._tools.keys()}
+        return {name: self.get_tool_config(name) for name in self._tools}
@@ -0,0 +1,55 @@
+"""Debate transcript that renders prompt text incrementally."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def format_turn(turn: Dict[str, Any]) -> Optional[str]:
+    """Render one turn as ``[Speaker] content``; ``None`` if it has no content."""
+    speaker = turn.get("speaker") or turn.get("agent") or "Unknown"
+    content = str(turn.get("content") or turn.get("response") or "").strip()
+    if not content:
+        return None
+    return f"[{speaker}] {content}"
+
+
+class History(list):
+    """Append-only list of debate turns that caches each turn's rendered line.
+
+    Every agent turn formats the whole conversation into its prompt; keeping
+    the rendered lines means each new turn is formatted once instead of the
+    full transcript being rebuilt on every call. Only ``append``/``extend``
+    update the cache, so turns must not be edited or removed in place.
+
+    ``last_user`` points at the most recent turn spoken by the user.
+    """
+
+    def __init__(self, turns: Iterable[Dict[str, Any]] = ()) -> None:
+        super().__init__()
+        self._rendered: List[str] = []
+        self._text: Optional[str] = None
+        self.last_user: Optional[Dict[str, Any]] = None
+        self.extend(turns)
+
+    def append(self, turn: Dict[str, Any]) -> None:
+        super().append(turn)
+        if str(turn.get("speaker", "")).lower() == "user":
+            self.last_user = turn
+        line = format_turn(turn)
+        if line is not None:
+            self._rendered.append(line)
+            self._text = None
+
+    def extend(self, turns: Iterable[Dict[str, Any]]) -> None:
+        for turn in turns:
+            self.append(turn)
+
+    def __iadd__(self, turns: Iterable[Dict[str, Any]]) -> "History":
+        self.extend(turns)
+        return self
+
+    def render(self) -> str:
+        """Return all non-empty turns joined as ``[Speaker] content`` lines."""
+        if self._text is None:
+            self._text = "\n".join(self._rendered)
+        return self._text
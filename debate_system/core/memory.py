@@ -1,15 +1,25 @@
 """Persistent memory store with search and metadata."""
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Dict, List, Optional, Set, Tuple
 from pathlib import Path
-import json
+import atexit
 import logging
+import os
+import re
+import time
+import weakref
+
+from ..utils.serialization import dumps, loads
 
 logger = logging.getLogger(__name__)
 
+_TOKEN_RE = re.compile(r"\w+")
+
 
 @dataclass
 class MemoryEntry:
@@ -17,62 +27,150 @@ class MemoryEntry:
 
     key: str
     value: Any
-    timestamp: str
+    timestamp: int  # nanoseconds since the epoch (time.time_ns())
     source: str
 
+    @property
+    def timestamp_iso(self) -> str:
+        seconds, nanos = divmod(self.timestamp, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=nanos // 1000).isoformat()
+
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MemoryEntry":
+        data = dict(data)
+        if isinstance(data.get("timestamp"), str):
+            # Entries saved before timestamps became integers
+            dt = datetime.fromisoformat(data["timestamp"])
+            data["timestamp"] = int(dt.replace(microsecond=0).timestamp()) * 1_000_000_000 + dt.microsecond * 1000
         return cls(**data)
 
 
 class MemoryStore:
-    """Persistent key-value memory with search capabilities."""
+    """Persistent key-value memory with search capabilities.
 
-    def __init__(self, persist_path: Optional[str] = None, auto_save: bool = True, max_entries: int = 1000) -> None:
+    A ``.jsonl`` persist path is kept as an append-only log (one entry per
+    line, last write wins on load) that is compacted every ``compact_every``
+    appended lines; any other path is rewritten as a single JSON snapshot.
+    """
+
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        auto_save: bool = True,
+        max_entries: int = 1000,
+        save_interval: int = 16,
+        compact_every: int = 1000,
+    ) -> None:
         self.persist_path = Path(persist_path) if persist_path else None
         self.auto_save = auto_save
         self.max_entries = max_entries
-        self.entries: Dict[str, MemoryEntry] = {}
+        # Auto-save writes once every ``save_interval`` changes; call flush() to force it
+        self.save_interval = max(1, save_interval)
+        self.compact_every = max(1, compact_every)
+        self._journal = self.persist_path is not None and self.persist_path.suffix == ".jsonl"
+        self._pending_lines: List[bytes] = []
+        self._log_lines = 0
+        self._needs_snapshot = False
+        # Insertion-ordered, oldest first: re-adding a key moves it to the end
+        self.entries: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        self._dirty = False
+        self._pending = 0
+        # Search index: token -> keys containing it, plus per-key insertion
+        # sequence (for recency ordering) and lowercased (key, value) text
+        self._token_index: Dict[str, Set[str]] = {}
+        self._search_text: Dict[str, Tuple[int, str, str]] = {}
+        self._index_seq = 0
 
         if self.persist_path:
             self._load()
+            atexit.register(_flush_at_exit, weakref.ref(self))
 
     def add_entry(self, key: str, value: Any, source: str = "system") -> None:
         entry = MemoryEntry(
             key=key,
             value=value,
-            timestamp=datetime.now().isoformat(),
+            timestamp=time.time_ns(),
             source=source,
         )
+        if self.entries.pop(key, None) is not None:
+            self._unindex(key)
         self.entries[key] = entry
+        self._index(entry)
 
-        if len(self.entries) > self.max_entries:
+        while len(self.entries) > self.max_entries:
             # Drop oldest entry when exceeding capacity
-            oldest_key = sorted(self.entries.values(), key=lambda e: e.timestamp)[0].key
-            self.entries.pop(oldest_key, None)
+            oldest_key, _ = self.entries.popitem(last=False)
+            self._unindex(oldest_key)
 
-        if self.auto_save:
-            self._save()
+        if self._journal:
+            line = _encode_line(entry)
+            if line is not None:
+                self._pending_lines.append(line)
+        self._mark_dirty()
 
     def get_entry(self, key: str) -> Optional[Any]:
         entry = self.entries.get(key)
         return entry.value if entry else None
 
     def search(self, query: str, limit: int = 10) -> List[MemoryEntry]:
+        """Return entries whose key or value contains ``query``, newest first.
+
+        Every word of a matching query lies inside some indexed token of the
+        entry, so candidates are the entries holding, for each query word, a
+        token that contains it; the substring check below stays authoritative.
+        """
         query_lower = query.lower()
-        results = [
+        words = _TOKEN_RE.findall(query_lower)
+        if words:
+            keys: Optional[Set[str]] = None
+            for word in sorted(set(words), key=len, reverse=True):
+                holders: Set[str] = set()
+                for tok, tok_keys in self._token_index.items():
+                    if word in tok:
+                        holders |= tok_keys
+                keys = holders if keys is None else keys & holders
+                if not keys:
+                    return []
+            ordered = sorted(keys, key=lambda k: self._search_text[k][0], reverse=True)
+            candidates = (self.entries[k] for k in ordered)
+        else:
+            candidates = reversed(self.entries.values())
+
+        matches = (
             entry
-            for entry in self.entries.values()
-            if query_lower in entry.key.lower() or query_lower in str(entry.value).lower()
-        ]
-        results.sort(key=lambda e: e.timestamp, reverse=True)
-        return results[:limit]
+            for entry in candidates
+            if self._matches(entry.key, query_lower)
+        )
+        return list(islice(matches, limit))
+
+    def _matches(self, key: str, query_lower: str) -> bool:
+        _, key_text, value_text = self._search_text[key]
+        return query_lower in key_text or query_lower in value_text
+
+    def _index(self, entry: MemoryEntry) -> None:
+        key_text, value_text = entry.key.lower(), str(entry.value).lower()
+        self._index_seq += 1
+        self._search_text[entry.key] = (self._index_seq, key_text, value_text)
+        for tok in _TOKEN_RE.findall(f"{key_text} {value_text}"):
+            self._token_index.setdefault(tok, set()).add(entry.key)
+
+    def _unindex(self, key: str) -> None:
+        indexed = self._search_text.pop(key, None)
+        if indexed is None:
+            return
+        _, key_text, value_text = indexed
+        for tok in _TOKEN_RE.findall(f"{key_text} {value_text}"):
+            keys = self._token_index.get(tok)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._token_index[tok]
 
     def get_recent(self, n: int = 5) -> List[MemoryEntry]:
-        return sorted(self.entries.values(), key=lambda e: e.timestamp, reverse=True)[:n]
+        return list(islice(reversed(self.entries.values()), n))
 
     def format_for_prompt(self, limit: int = 5) -> str:
         recent = self.get_recent(limit)
@@ -93,30 +191,140 @@ class MemoryStore:
 
     def clear(self) -> None:
         self.entries.clear()
+        self._token_index.clear()
+        self._search_text.clear()
+        self._pending_lines.clear()
+        self._needs_snapshot = True
+        self._dirty = True
         if self.auto_save:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write pending changes to disk, if any."""
+        if not self._dirty:
+            return
+        if not self.persist_path:
+            self._reset_pending()
+            return
+        if (
+            self._journal
+            and not self._needs_snapshot
+            and self._log_lines + len(self._pending_lines) < self.compact_every
+        ):
+            self._append_pending()
+        else:
             self._save()
 
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        self._pending += 1
+        if self.auto_save and self._pending >= self.save_interval:
+            self.flush()
+
+    def _reset_pending(self) -> None:
+        self._dirty = False
+        self._pending = 0
+        self._pending_lines.clear()
+        self._needs_snapshot = False
+
+    def _append_pending(self) -> None:
+        assert self.persist_path is not None
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.persist_path, "ab") as f:
+                f.write(b"".join(self._pending_lines))
+            self._log_lines += len(self._pending_lines)
+            self._reset_pending()
+        except Exception as exc:
+            logger.error(f"Failed to save memory: {exc}")
+
     def _save(self) -> None:
         if not self.persist_path:
             return
         try:
             self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-            data = {k: v.to_dict() for k, v in self.entries.items()}
-            with open(self.persist_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            if self._journal:
+                # Compacted log: one line per live entry
+                payload = b"".join(filter(None, map(_encode_line, self.entries.values())))
+            else:
+                payload = dumps(self.entries)
+            # Write to a sibling file and rename so a crash never leaves a torn file
+            tmp_path = self.persist_path.with_name(self.persist_path.name + ".tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, self.persist_path)
+            self._log_lines = len(self.entries) if self._journal else 0
+            self._reset_pending()
         except Exception as exc:
             logger.error(f"Failed to save memory: {exc}")
 
     def _load(self) -> None:
-        if not self.persist_path or not self.persist_path.exists():
+        if not self.persist_path:
             return
+        path = self.persist_path
         try:
-            with open(self.persist_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            self.entries = {k: MemoryEntry.from_dict(v) for k, v in data.items()}
+            if self._journal and path.exists():
+                self._load_journal(path)
+            elif self._journal and path.with_suffix(".json").exists():
+                # Migrate a snapshot written by older versions on the next flush
+                self._load_snapshot(path.with_suffix(".json"))
+                self._needs_snapshot = True
+                self._dirty = True
+            elif not self._journal and path.exists():
+                self._load_snapshot(path)
         except Exception as exc:
             logger.error(f"Failed to load memory: {exc}")
-            self.entries = {}
+            self.entries = OrderedDict()
+        for entry in self.entries.values():
+            self._index(entry)
+
+    def _load_snapshot(self, path: Path) -> None:
+        data = loads(path.read_bytes())
+        loaded = sorted(
+            (MemoryEntry.from_dict(v) for v in data.values()),
+            key=lambda e: e.timestamp,
+        )
+        self.entries = OrderedDict((e.key, e) for e in loaded)
+
+    def _load_journal(self, path: Path) -> None:
+        entries: "OrderedDict[str, MemoryEntry]" = OrderedDict()
+        lines = path.read_bytes().splitlines()
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                entry = MemoryEntry.from_dict(loads(line))
+            except Exception as exc:
+                # A crash mid-append can leave a torn final line
+                logger.warning(f"Skipping unreadable memory record: {exc}")
+                continue
+            entries.pop(entry.key, None)
+            entries[entry.key] = entry
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        self.entries = entries
+        self._log_lines = len(lines)
 
     def __len__(self) -> int:
         return len(self.entries)
+
+    def __enter__(self) -> "MemoryStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.flush()
+
+
+def _encode_line(entry: MemoryEntry) -> Optional[bytes]:
+    """Serialize ``entry`` as a journal line, or log and return None if it cannot be."""
+    try:
+        return dumps(entry) + b"\n"
+    except Exception as exc:
+        logger.error(f"Failed to save memory entry {entry.key!r}: {exc}")
+        return None
+
+
+def _flush_at_exit(store_ref: "weakref.ref[MemoryStore]") -> None:
+    store = store_ref()
+    # Stores without auto_save only ever write when flushed explicitly
+    if store is not None and store.auto_save:
+        store.flush()
@@ -1,14 +1,17 @@
 """Coordinates multi-agent debates."""
 from __future__ import annotations
 
+import asyncio
 import logging
 import random
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
 from ..agents import AristotleAgent, BaseAgent, PlatoAgent, SocratesAgent, SummaryAgent
 from ..core.config import ConfigManager, OrchestratorConfig
+from ..core.history import History
 from ..core.memory import MemoryStore
-from ..inference.manager import initialize_model
+from ..inference.manager import generate_text, generate_text_batch, initialize_model
 from ..utils.validators import ensure_non_empty
 
 logger = logging.getLogger(__name__)
@@ -24,21 +27,32 @@ class DebateOrchestrator:
         orchestrator_config: Optional[OrchestratorConfig] = None,
     ) -> None:
         self.config_manager = config_manager
-        self.memory = memory_store or MemoryStore(
-            persist_path=self.config_manager.get_memory_config().persist_path,
-            auto_save=self.config_manager.get_memory_config().auto_save,
-            max_entries=self.config_manager.get_memory_config().max_entries,
-        )
         self.config = orchestrator_config or self.config_manager.get_orchestrator_config()
 
         if self.config.random_seed is not None:
             random.seed(self.config.random_seed)
 
-        self.agents: Dict[str, BaseAgent] = {}
-        self._init_agents()
+        # Model backend setup and memory loading are I/O-bound; run them while
+        # the agents are built instead of one after another.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            model_future = executor.submit(initialize_model, self.config_manager.get_model_config())
+            memory_future = executor.submit(self._build_memory_store) if memory_store is None else None
+
+            self.agents: Dict[str, BaseAgent] = {}
+            self._init_agents()
 
-        # Initialize model backend once
-        initialize_model(self.config_manager.get_model_config())
+            self.memory = memory_store if memory_future is None else memory_future.result()
+            model_future.result()
+
+    def _build_memory_store(self) -> MemoryStore:
+        memory_config = self.config_manager.get_memory_config()
+        return MemoryStore(
+            persist_path=memory_config.persist_path,
+            auto_save=memory_config.auto_save,
+            max_entries=memory_config.max_entries,
+            save_interval=memory_config.save_interval,
+            compact_every=memory_config.compact_every,
+        )
 
     def _init_agents(self) -> None:
         factory = {
@@ -71,13 +85,29 @@ class DebateOrchestrator:
             last_result = result
         return last_result
 
-    def stream_debate(self, question: str, rounds: Optional[int] = None, enable_summary: Optional[bool] = None):
-        """Yields intermediate debate results for streaming."""
+    def stream_debate(
+        self,
+        question: str,
+        rounds: Optional[int] = None,
+        enable_summary: Optional[bool] = None,
+        stream_tokens: bool = False,
+    ):
+        """Yields intermediate debate results for streaming.
+
+        With ``stream_tokens`` each turn is also yielded while it is being
+        generated, with ``status="streaming"`` and the in-progress turn under
+        ``"partial"``; ``history`` only ever holds finished turns.
+
+        With ``parallel_agents`` each round is answered by one batched
+        generation call (see ``_get_round_responses``); those rounds are not
+        token-streamed. ``astream_debate`` is the separate entry point for
+        callers already running an event loop.
+        """
         question = ensure_non_empty(question, "question")
         rounds = rounds or self.config.default_rounds
         enable_summary = self.config.enable_summary if enable_summary is None else enable_summary
 
-        history: List[Dict[str, object]] = [{"speaker": "User", "content": question}]
+        history = History([{"speaker": "User", "content": question}])
         self.memory.add_entry(key="initial_question", value=question, source="user")
         
         yield {
@@ -90,8 +120,31 @@ class DebateOrchestrator:
 
         for round_idx in range(1, rounds + 1):
             logger.info(f"Round {round_idx}/{rounds}")
+            if self.config.parallel_agents:
+                order = self._agent_order()
+                responses = self._get_round_responses(order, question, history)
+                for (_, agent), response in zip(order, responses):
+                    history.append({
+                        "speaker": agent.name,
+                        "content": response,
+                        "round": round_idx,
+                    })
+                yield {
+                    "question": question,
+                    "history": history,
+                    "summary": None,
+                    "error": None,
+                    "status": "debating"
+                }
+                continue
+
             for agent_key, agent in self._agent_order():
-                response = self._get_agent_response(agent_key, agent, question, history)
+                if stream_tokens:
+                    response = ""
+                    for response in self._stream_agent_response(agent_key, agent, question, history):
+                        yield self._streaming_result(question, history, agent.name, response, round_idx)
+                else:
+                    response = self._get_agent_response(agent_key, agent, question, history)
                 history.append({
                     "speaker": agent.name,
                     "content": response,
@@ -107,12 +160,21 @@ class DebateOrchestrator:
 
         summary_text: Optional[str] = None
         if enable_summary and "summary" in self.agents:
+            summary_agent = self.agents["summary"]
             try:
-                summary_text = self.agents["summary"].generate_response(question, history, self.memory)
+                if stream_tokens:
+                    for summary_text in summary_agent.stream_response(question, history, self.memory):
+                        yield self._streaming_result(question, history, "Summary", summary_text)
+                else:
+                    summary_text = summary_agent.generate_response(question, history, self.memory)
                 history.append({"speaker": "Summary", "content": summary_text})
             except Exception as exc:
+                summary_text = None
                 logger.error(f"Summary generation failed: {exc}")
 
+        if self.memory.auto_save:
+            self.memory.flush()
+
         yield {
             "question": question,
             "history": history,
@@ -121,6 +183,42 @@ class DebateOrchestrator:
             "status": "completed"
         }
 
+    @staticmethod
+    def _streaming_result(
+        question: str,
+        history: List[Dict[str, object]],
+        speaker: str,
+        content: str,
+        round_idx: Optional[int] = None,
+    ) -> Dict[str, object]:
+        partial: Dict[str, object] = {"speaker": speaker, "content": content}
+        if round_idx is not None:
+            partial["round"] = round_idx
+        return {
+            "question": question,
+            "history": history,
+            "summary": None,
+            "error": None,
+            "status": "streaming",
+            "partial": partial,
+        }
+
+    def _stream_agent_response(
+        self,
+        agent_key: str,
+        agent: BaseAgent,
+        question: str,
+        history: List[Dict[str, object]],
+    ) -> Iterator[str]:
+        """Yield the agent's reply so far; the last item is the final reply."""
+        for attempt in range(self.config.max_retries):
+            try:
+                yield from agent.stream_response(question, history, self.memory)
+                return
+            except Exception as exc:
+                logger.warning(f"{agent_key} attempt {attempt + 1} failed: {exc}")
+        yield f"[Error: {agent_key} failed after {self.config.max_retries} attempts]"
+
     def _get_agent_response(
         self,
         agent_key: str,
@@ -135,6 +233,134 @@ class DebateOrchestrator:
                 logger.warning(f"{agent_key} attempt {attempt + 1} failed: {exc}")
         return f"[Error: {agent_key} failed after {self.config.max_retries} attempts]"
 
+    def _get_round_responses(
+        self,
+        order: List[Tuple[str, BaseAgent]],
+        question: str,
+        history: List[Dict[str, object]],
+    ) -> List[str]:
+        """Answer one round with a single batched generation call.
+
+        Prompts are built once; if the batch fails only generation is retried
+        per agent, so tool calls and memory writes are not repeated.
+        """
+        prepared = [agent.prepare_prompt(question, history, self.memory) for _, agent in order]
+        requests = []
+        for (_, agent), (prompt, _) in zip(order, prepared):
+            params = agent.generation_params()
+            requests.append((prompt, params["temperature"], params["max_new_tokens"]))
+        try:
+            raws: List[Optional[str]] = list(generate_text_batch(requests))
+        except Exception as exc:
+            logger.warning(f"Batched round failed, falling back to per-agent calls: {exc}")
+            raws = [self._generate_with_retries(key, request) for (key, _), request in zip(order, requests)]
+
+        responses = []
+        for (agent_key, agent), raw, (_, used_tool) in zip(order, raws, prepared):
+            if raw is None:
+                responses.append(f"[Error: {agent_key} failed after {self.config.max_retries} attempts]")
+            else:
+                responses.append(agent.finalize_response(raw, history, self.memory, used_tool))
+        return responses
+
+    def _generate_with_retries(self, agent_key: str, request: Tuple[str, float, int]) -> Optional[str]:
+        prompt, temperature, max_new_tokens = request
+        for attempt in range(self.config.max_retries):
+            try:
+                return generate_text(prompt, temperature, max_new_tokens)
+            except Exception as exc:
+                logger.warning(f"{agent_key} attempt {attempt + 1} failed: {exc}")
+        return None
+
+    async def arun_debate(self, question: str, rounds: Optional[int] = None, enable_summary: Optional[bool] = None) -> Dict[str, object]:
+        last_result: Dict[str, object] = {}
+        async for result in self.astream_debate(question, rounds, enable_summary):
+            last_result = result
+        return last_result
+
+    async def astream_debate(
+        self,
+        question: str,
+        rounds: Optional[int] = None,
+        enable_summary: Optional[bool] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async variant of ``stream_debate`` that runs each round's agents concurrently.
+
+        Agents within a round all answer the history as it stood when the round
+        started, so one result is yielded per round rather than per turn.
+        """
+        question = ensure_non_empty(question, "question")
+        rounds = rounds or self.config.default_rounds
+        enable_summary = self.config.enable_summary if enable_summary is None else enable_summary
+
+        history = History([{"speaker": "User", "content": question}])
+        self.memory.add_entry(key="initial_question", value=question, source="user")
+
+        yield {
+            "question": question,
+            "history": history,
+            "summary": None,
+            "error": None,
+            "status": "started"
+        }
+
+        semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        for round_idx in range(1, rounds + 1):
+            logger.info(f"Round {round_idx}/{rounds}")
+            order = self._agent_order()
+            responses = await asyncio.gather(*[
+                self._aget_agent_response(agent_key, agent, question, history, semaphore)
+                for agent_key, agent in order
+            ])
+            for (_, agent), response in zip(order, responses):
+                history.append({
+                    "speaker": agent.name,
+                    "content": response,
+                    "round": round_idx,
+                })
+            yield {
+                "question": question,
+                "history": history,
+                "summary": None,
+                "error": None,
+                "status": "debating"
+            }
+
+        summary_text: Optional[str] = None
+        if enable_summary and "summary" in self.agents:
+            try:
+                summary_text = await self.agents["summary"].agenerate_response(question, history, self.memory)
+                history.append({"speaker": "Summary", "content": summary_text})
+            except Exception as exc:
+                logger.error(f"Summary generation failed: {exc}")
+
+        if self.memory.auto_save:
+            self.memory.flush()
+
+        yield {
+            "question": question,
+            "history": history,
+            "summary": summary_text,
+            "error": None,
+            "status": "completed"
+        }
+
+    async def _aget_agent_response(
+        self,
+        agent_key: str,
+        agent: BaseAgent,
+        question: str,
+        history: List[Dict[str, object]],
+        semaphore: asyncio.Semaphore,
+    ) -> str:
+        async with semaphore:
+            for attempt in range(self.config.max_retries):
+                try:
+                    return await agent.agenerate_response(question, history, self.memory)
+                except Exception as exc:
+                    logger.warning(f"{agent_key} attempt {attempt + 1} failed: {exc}")
+        return f"[Error: {agent_key} failed after {self.config.max_retries} attempts]"
+
     def format_history(self, history: List[Dict[str, object]]) -> str:
         lines = []
         for entry in history:
@@ -1,16 +1,47 @@
 """Tool implementations with registry support."""
 from __future__ import annotations
 
+import ast
+import asyncio
+import functools
 import logging
+import operator
 import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
 
 import requests
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional speedup
+    aiohttp = None
+
+from ..utils.http import MAX_RETRIES, build_session
+from ..utils.serialization import loads
+
 logger = logging.getLogger(__name__)
 
 TOOL_REGISTRY: Dict[str, Callable[..., Any]] = {}
+# Native coroutine implementations, preferred by ``aexecute_tool`` when present
+ASYNC_TOOL_REGISTRY: Dict[str, Callable[..., Awaitable[Any]]] = {}
+
+# Reused across searches so the TLS connection to DuckDuckGo stays warm
+_SESSION = build_session()
+
+# Upper bound on tools running concurrently from async callers
+MAX_CONCURRENT_TOOLS = 4
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TOOLS, thread_name_prefix="debate-tool")
+# One semaphore per event loop; asyncio primitives cannot be shared across loops
+_TOOL_SEMAPHORES: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
 
 
 def register_tool(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
@@ -23,6 +54,102 @@ def register_tool(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any
     return decorator
 
 
+def register_async_tool(name: str) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Decorator to register the coroutine variant of a tool."""
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        ASYNC_TOOL_REGISTRY[name] = func
+        return func
+
+    return decorator
+
+
+_SEARCH_URL = "https://api.duckduckgo.com/"
+_NO_RESULTS = "No results found"
+
+# Recent searches, so repeated lookups within a session skip the round trip.
+# Misses are kept separately: they are common for free-form questions and
+# do not depend on ``max_results``.
+SEARCH_CACHE_TTL = 600.0
+SEARCH_CACHE_SIZE = 256
+NEGATIVE_CACHE_TTL = 300.0
+NEGATIVE_CACHE_SIZE = 1024
+_SEARCH_CACHE: "OrderedDict[Tuple[str, int], Tuple[float, List[str]]]" = OrderedDict()
+_NEG_CACHE: "OrderedDict[str, float]" = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+
+def _cached_search(query: str, max_results: int) -> Optional[List[str]]:
+    key = query.lower()
+    now = time.monotonic()
+    with _search_cache_lock:
+        missed_at = _NEG_CACHE.get(key)
+        if missed_at is not None:
+            if now - missed_at < NEGATIVE_CACHE_TTL:
+                return [_NO_RESULTS]
+            del _NEG_CACHE[key]
+        hit = _SEARCH_CACHE.get((key, max_results))
+        if hit is not None:
+            if now - hit[0] < SEARCH_CACHE_TTL:
+                _SEARCH_CACHE.move_to_end((key, max_results))
+                return list(hit[1])
+            del _SEARCH_CACHE[(key, max_results)]
+    return None
+
+
+def _store_search(query: str, max_results: int, results: List[str]) -> None:
+    key = query.lower()
+    now = time.monotonic()
+    with _search_cache_lock:
+        if results == [_NO_RESULTS]:
+            cache, entry, limit = _NEG_CACHE, key, NEGATIVE_CACHE_SIZE
+            cache[entry] = now
+        else:
+            cache, entry, limit = _SEARCH_CACHE, (key, max_results), SEARCH_CACHE_SIZE
+            cache[entry] = (now, list(results))
+        cache.move_to_end(entry)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+
+def clear_search_cache() -> None:
+    """Forget all cached search results and misses."""
+    with _search_cache_lock:
+        _SEARCH_CACHE.clear()
+        _NEG_CACHE.clear()
+
+
+def _search_params(query: str) -> Dict[str, Any]:
+    return {
+        "q": query,
+        "format": "json",
+        "no_html": 1,
+        "skip_disambig": 1,
+    }
+
+
+def _parse_search_results(data: Dict[str, Any], max_results: int) -> List[str]:
+    results: List[str] = []
+
+    abstract = data.get("Abstract")
+    if abstract:
+        results.append("Summary: " + abstract)
+
+    # Lazily filtered, so only as many topics as needed are inspected
+    topics = (
+        topic["Text"]
+        for topic in data.get("RelatedTopics", ())
+        if isinstance(topic, dict) and topic.get("Text")
+    )
+    results.extend(islice(topics, max_results))
+
+    definition = data.get("Definition")
+    if definition:
+        results.append("Definition: " + definition)
+
+    return results or [_NO_RESULTS]
+
+
 @register_tool("web_search")
 def web_search(query: str, max_results: int = 5, timeout: int = 10) -> List[str]:
     """DuckDuckGo Instant Answer API search."""
@@ -30,82 +157,186 @@ def web_search(query: str, max_results: int = 5, timeout: int = 10) -> List[str]
     if not cleaned_query:
         return ["No query provided"]
 
+    cached = _cached_search(cleaned_query, max_results)
+    if cached is not None:
+        return cached
+
+    # Only connects are retried, so only the connect budget is split across attempts
+    timeouts = (timeout / (MAX_RETRIES + 1), timeout)
     try:
-        url = "https://api.duckduckgo.com/"
-        params = {
-            "q": cleaned_query,
-            "format": "json",
-            "no_html": 1,
-            "skip_disambig": 1,
-        }
-        response = requests.get(url, params=params, timeout=timeout)
+        response = _SESSION.get(_SEARCH_URL, params=_search_params(cleaned_query), timeout=timeouts)
         response.raise_for_status()
-        data = response.json()
+        results = _parse_search_results(loads(response.content), max_results)
+        _store_search(cleaned_query, max_results, results)
+        return results
+    except requests.Timeout:
+        return [f"Search timed out after {timeout} seconds"]
+    except Exception as exc:
+        logger.warning("Web search failed: %s", exc)
+        return [f"Search error: {exc}"]
 
-        results: List[str] = []
 
-        abstract = data.get("Abstract")
-        if abstract:
-            results.append(f"Summary: {abstract}")
+if aiohttp is not None:
 
-        for topic in data.get("RelatedTopics", [])[:max_results]:
-            if isinstance(topic, dict) and topic.get("Text"):
-                results.append(topic["Text"])
+    # Like ``_SESSION`` for the async path, but sessions are bound to the loop
+    # that created them and each ``asyncio.run`` debate starts a fresh loop.
+    # Values pair each session with the generator that closes it
+    _AIOHTTP_SESSIONS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Any, AsyncIterator[None]]]" = (
+        weakref.WeakKeyDictionary()
+    )
 
-        definition = data.get("Definition")
-        if definition:
-            results.append(f"Definition: {definition}")
+    async def _close_with_loop(session: aiohttp.ClientSession) -> AsyncIterator[None]:
+        # Loop shutdown (``shutdown_asyncgens``) finalizes this generator
+        try:
+            yield
+        finally:
+            await session.close()
 
-        return results or ["No results found"]
-    except requests.Timeout:
-        return [f"Search timed out after {timeout} seconds"]
-    except Exception as exc:
-        logger.warning(f"Web search failed: {exc}")
-        return [f"Search error: {exc}"]
+    async def _aiohttp_session() -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        entry = _AIOHTTP_SESSIONS.get(loop)
+        if entry is None or entry[0].closed:
+            session = aiohttp.ClientSession()
+            closer = _close_with_loop(session)
+            entry = _AIOHTTP_SESSIONS[loop] = (session, closer)
+            await closer.__anext__()
+        return entry[0]
+
+    @register_async_tool("web_search")
+    async def web_search_async(query: str, max_results: int = 5, timeout: int = 10) -> List[str]:
+        """Coroutine ``web_search`` that overlaps the request with other awaits."""
+        cleaned_query = query.strip()
+        if not cleaned_query:
+            return ["No query provided"]
+
+        cached = _cached_search(cleaned_query, max_results)
+        if cached is not None:
+            return cached
+
+        try:
+            session = await _aiohttp_session()
+            async with session.get(
+                _SEARCH_URL,
+                params=_search_params(cleaned_query),
+                timeout=aiohttp.ClientTimeout(total=timeout),
+            ) as response:
+                response.raise_for_status()
+                data = loads(await response.read())
+            results = _parse_search_results(data, max_results)
+            _store_search(cleaned_query, max_results, results)
+            return results
+        except asyncio.TimeoutError:
+            return [f"Search timed out after {timeout} seconds"]
+        except Exception as exc:
+            logger.warning("Web search failed: %s", exc)
+            return [f"Search error: {exc}"]
+
+
+_BINOPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARYOPS: Dict[type, Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_STRIP_ALLOWED = str.maketrans("", "", "0123456789+-*/()% .")
+# Keeps inputs like ``9 ** 9 ** 9`` from pinning the CPU
+MAX_EXPONENT = 1000
+# Nested powers like ``(9 ** 999) ** 999`` stay under MAX_EXPONENT but not in memory
+MAX_RESULT_BITS = 10_000
+
+
+def _eval_node(node: ast.AST) -> Any:
+    if isinstance(node, ast.Expression):
+        return _eval_node(node.body)
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINOPS:
+        left = _eval_node(node.left)
+        right = _eval_node(node.right)
+        if isinstance(node.op, ast.Pow):
+            if abs(right) > MAX_EXPONENT:
+                raise ValueError(f"Exponent too large (limit {MAX_EXPONENT})")
+            if isinstance(left, int) and isinstance(right, int) and abs(left).bit_length() * right > MAX_RESULT_BITS:
+                raise ValueError(f"Result too large (limit {MAX_RESULT_BITS} bits)")
+        return _BINOPS[type(node.op)](left, right)
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARYOPS:
+        return _UNARYOPS[type(node.op)](_eval_node(node.operand))
+    raise ValueError(f"Unsupported expression element: {type(node).__name__}")
 
 
 @register_tool("calculate")
+@functools.lru_cache(maxsize=512)
 def calculate(expression: str) -> str:
     """Safely evaluate arithmetic expressions."""
     try:
-        allowed = set("0123456789+-*/()% .")
-        if not all(ch in allowed for ch in expression):
+        # Anything left after deleting the allowed characters is invalid
+        if expression.translate(_STRIP_ALLOWED):
             return "Error: Invalid characters in expression"
 
-        result = eval(expression, {"__builtins__": {}}, {})
+        result = _eval_node(ast.parse(expression.strip(), mode="eval"))
         return f"Result: {result}"
     except ZeroDivisionError:
         return "Error: Division by zero"
     except Exception as exc:
-        logger.warning(f"Calculation failed: {exc}")
+        logger.warning("Calculation failed: %s", exc)
         return f"Calculation error: {exc}"
 
 
+_INFO_FORMATS = {"date": "%Y-%m-%d", "time": "%H:%M:%S"}
+_DEFAULT_INFO_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
 @register_tool("get_current_info")
 def get_current_info(info_type: str = "datetime") -> str:
     """Return current date/time information."""
-    now = datetime.now()
-    choice = info_type.lower()
-
-    if choice == "date":
-        return now.strftime("%Y-%m-%d")
-    if choice == "time":
-        return now.strftime("%H:%M:%S")
-    return now.strftime("%Y-%m-%d %H:%M:%S")
+    fmt = _INFO_FORMATS.get(info_type) or _INFO_FORMATS.get(info_type.lower(), _DEFAULT_INFO_FORMAT)
+    return format(datetime.now(), fmt)
 
 
 def execute_tool(tool_name: str, *args: Any, **kwargs: Any) -> Any:
     """Run a registered tool with error handling."""
-    if tool_name not in TOOL_REGISTRY:
+    func = TOOL_REGISTRY.get(tool_name)
+    if func is None:
         return f"Error: Tool '{tool_name}' not found"
 
     try:
-        return TOOL_REGISTRY[tool_name](*args, **kwargs)
+        return func(*args, **kwargs)
     except Exception as exc:
-        logger.error(f"Tool execution error ({tool_name}): {exc}")
+        logger.error("Tool execution error (%s): %s", tool_name, exc)
         return f"Tool execution error: {exc}"
 
 
+async def aexecute_tool(tool_name: str, *args: Any, **kwargs: Any) -> Any:
+    """Awaitable ``execute_tool``.
+
+    Tools with a registered coroutine variant are awaited directly; the rest
+    run on a bounded worker pool. Either way at most ``MAX_CONCURRENT_TOOLS``
+    calls are in flight per event loop.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _TOOL_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _TOOL_SEMAPHORES[loop] = asyncio.Semaphore(MAX_CONCURRENT_TOOLS)
+
+    async with semaphore:
+        async_tool = ASYNC_TOOL_REGISTRY.get(tool_name)
+        if async_tool is not None:
+            try:
+                return await async_tool(*args, **kwargs)
+            except Exception as exc:
+                logger.error("Tool execution error (%s): %s", tool_name, exc)
+                return f"Tool execution error: {exc}"
+        call = functools.partial(execute_tool, tool_name, *args, **kwargs)
+        return await loop.run_in_executor(_TOOL_EXECUTOR, call)
+
+
 def list_tools() -> List[str]:
     """Return registered tool names."""
     return list(TOOL_REGISTRY.keys())
@@ -1,14 +1,18 @@
 """Model backend implementations."""
 from __future__ import annotations
 
+import importlib.util
 import logging
-from typing import Any
-
-import requests
-from transformers import pipeline
-import torch
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from ..core.config import ModelConfig
+from ..utils.http import build_session
+from ..utils.serialization import loads
+
+if TYPE_CHECKING:  # torch/transformers are imported on first use; see TransformersBackend
+    import torch
+    from transformers import BitsAndBytesConfig, DynamicCache
 
 logger = logging.getLogger(__name__)
 
@@ -16,40 +20,92 @@ logger = logging.getLogger(__name__)
 class OllamaBackend:
     """Ollama local inference backend."""
 
+    # Keep the model (and its prompt cache) resident between turns
+    KEEP_ALIVE = "60m"
+    CONTEXT_TOKENS = 4096
+
     def __init__(self, config: ModelConfig):
         self.model_name = config.model_name
         self.base_url = "http://localhost:11434"
         self.timeout = config.timeout
+        self._session = build_session()
+        # Load the model in the background so the first question does not pay for it
+        Thread(target=self._warm_up, args=(self._session,), daemon=True).start()
+
+    def _warm_up(self, session: Any) -> None:
+        try:
+            # A request without a prompt only loads the model
+            session.post(
+                f"{self.base_url}/api/generate",
+                json={"model": self.model_name, "keep_alive": self.KEEP_ALIVE},
+                timeout=self.timeout,
+            ).raise_for_status()
+        except Exception as exc:
+            logger.debug(f"Ollama warm-up skipped: {exc}")
 
     def generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        return "".join(self.generate_stream(prompt, temperature, max_tokens))
+
+    def generate_stream(self, prompt: str, temperature: float, max_tokens: int) -> Iterator[str]:
+        """Yield response text chunks as Ollama produces them."""
         payload = {
             "model": self.model_name,
             "prompt": prompt,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-            "stream": False,
+            "stream": True,
+            "keep_alive": self.KEEP_ALIVE,
+            # Sampling settings are only honoured inside "options"
+            "options": {
+                "temperature": temperature,
+                "num_predict": max_tokens,
+                "num_ctx": self.CONTEXT_TOKENS,
+            },
         }
-        response = requests.post(
+        with self._session.post(
             f"{self.base_url}/api/generate",
             json=payload,
             timeout=self.timeout,
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("response", "")
+            stream=True,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = loads(line)
+                chunk = data.get("response", "")
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    break
 
 
 class TransformersBackend:
-    """HuggingFace Transformers backend with optional quantization."""
+    """HuggingFace Transformers backend with optional quantization.
+
+    ``generate`` keeps the KV cache of the previous prompt and reuses it for
+    the longest token prefix the next prompt shares with it. Debate prompts
+    open with the question and transcript, so consecutive turns skip
+    re-encoding everything but the new tail.
+    """
+
+    # Shorter shared prefixes are not worth reusing
+    MIN_PREFIX_TOKENS = 16
 
     def __init__(self, config: ModelConfig):
         self.model_name = config.model_name
         self.device = self._resolve_device(config.device)
         self.quantization = config.quantization
-        self._pipeline = None
+        self._model = None
+        self._tokenizer = None
+        self._prefix_ids: Optional[torch.Tensor] = None
+        self._prefix_cache: Optional[DynamicCache] = None
+        self._lock = Lock()
+        # Separate from ``_lock`` so loading never waits behind a generation
+        self._init_lock = Lock()
 
     def _resolve_device(self, device: str) -> int:
         if device == "auto":
+            import torch
+
             return 0 if torch.cuda.is_available() else -1
         try:
             return int(device)
@@ -57,33 +113,207 @@ class TransformersBackend:
             return -1
 
     def _lazy_init(self) -> None:
-        if self._pipeline:
+        if self._model is not None:
             return
+        # Concurrent first calls (worker threads, Streamlit sessions) load the weights once
+        with self._init_lock:
+            if self._model is None:
+                self._load_model()
 
-        kwargs: dict[str, Any] = {}
-        if self.quantization == "8bit":
-            kwargs["load_in_8bit"] = True
-        elif self.quantization == "4bit":
-            kwargs["load_in_4bit"] = True
-
-        self._pipeline = pipeline(
-            task="text-generation",
-            model=self.model_name,
-            device=self.device,
-            **kwargs,
-        )
+    def _load_model(self) -> None:
+        from transformers import AutoModelForCausalLM, AutoTokenizer
+
+        dtype = self._compute_dtype()
+        kwargs: dict[str, Any] = {"attn_implementation": self._attn_implementation(dtype)}
+        if dtype is not None:
+            kwargs["torch_dtype"] = dtype
+        quantization_config = self._quantization_config()
+        if quantization_config is not None:
+            kwargs["quantization_config"] = quantization_config
+            kwargs["device_map"] = "auto"
+
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
+        # Batched generation pads prompts; decoder-only models must pad on the left
+        if tokenizer.pad_token_id is None:
+            tokenizer.pad_token_id = tokenizer.eos_token_id
+        tokenizer.padding_side = "left"
+
+        try:
+            model = AutoModelForCausalLM.from_pretrained(self.model_name, **kwargs)
+        except (ImportError, ValueError) as exc:
+            # Architectures without the requested attention kernel
+            logger.warning(f"{kwargs['attn_implementation']} attention unavailable, using default: {exc}")
+            kwargs.pop("attn_implementation")
+            model = AutoModelForCausalLM.from_pretrained(self.model_name, **kwargs)
+        # Quantized weights are placed at load time and cannot be moved
+        if quantization_config is None and self.device >= 0:
+            model.to(f"cuda:{self.device}")
+        model.eval()
+
+        # Fixed sampling settings live on the model's config; calls only pass overrides
+        model.generation_config.do_sample = True
+        model.generation_config.pad_token_id = tokenizer.pad_token_id
+
+        self._tokenizer = tokenizer
+        self._model = model
+
+    def _compute_dtype(self) -> Optional[torch.dtype]:
+        """Half precision on GPU (bf16 where supported); CPU keeps fp32."""
+        if self.device < 0:
+            return None
+        import torch
+
+        return torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+
+    @staticmethod
+    def _attn_implementation(dtype: Optional[torch.dtype]) -> str:
+        # FlashAttention-2 needs the flash_attn package and half-precision CUDA weights
+        if dtype is not None and importlib.util.find_spec("flash_attn") is not None:
+            return "flash_attention_2"
+        return "sdpa"
+
+    def _quantization_config(self) -> Optional[BitsAndBytesConfig]:
+        if self.quantization not in ("4bit", "8bit"):
+            return None
+        import torch
+        from transformers import BitsAndBytesConfig
+
+        if self.quantization == "4bit":
+            # NF4 with double quantization runs on the fast 4-bit kernels
+            return BitsAndBytesConfig(
+                load_in_4bit=True,
+                bnb_4bit_quant_type="nf4",
+                bnb_4bit_compute_dtype=self._compute_dtype() or torch.bfloat16,
+                bnb_4bit_use_double_quant=True,
+            )
+        return BitsAndBytesConfig(load_in_8bit=True, llm_int8_threshold=6.0)
+
+    def _reusable_cache(self, input_ids: torch.Tensor) -> DynamicCache:
+        """Return the stored KV cache cropped to the prefix shared with ``input_ids``."""
+        from transformers import DynamicCache
+
+        cache, prefix = self._prefix_cache, self._prefix_ids
+        # Cleared up front so a failed generation never leaves a half-updated cache
+        self._prefix_cache = self._prefix_ids = None
+        if cache is not None and prefix is not None:
+            # At least one prompt token must be left for the model to process
+            limit = min(prefix.shape[0], input_ids.shape[1] - 1)
+            mismatch = (prefix[:limit] != input_ids[0, :limit]).nonzero()
+            common = int(mismatch[0]) if len(mismatch) else limit
+            if common >= self.MIN_PREFIX_TOKENS:
+                try:
+                    self._crop(cache, common)
+                    return cache
+                except Exception as exc:  # e.g. sliding-window layers cannot be cropped
+                    logger.debug(f"Prefix cache not reusable: {exc}")
+        return DynamicCache()
+
+    @staticmethod
+    def _crop(cache: DynamicCache, length: int) -> None:
+        # Negative crops mean "drop this many tokens" across transformers releases
+        excess = cache.get_seq_length() - length
+        if excess > 0:
+            cache.crop(-excess)
+
+    def _generate_with_prefix_cache(self, input_ids: torch.Tensor, **kwargs: Any) -> torch.Tensor:
+        import torch
+
+        prompt_len = input_ids.shape[1]
+        with self._lock:
+            cache = self._reusable_cache(input_ids)
+            output = self._model.generate(
+                input_ids,
+                attention_mask=torch.ones_like(input_ids),
+                past_key_values=cache,
+                **kwargs,
+            )
+            try:
+                self._crop(cache, prompt_len)
+                self._prefix_ids, self._prefix_cache = input_ids[0], cache
+            except Exception as exc:
+                logger.debug(f"Prefix cache not stored: {exc}")
+        return output
+
+    def _encode(self, prompt: str) -> torch.Tensor:
+        return self._tokenizer(prompt, return_tensors="pt").input_ids.to(self._model.device)
 
     def generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
         self._lazy_init()
-        assert self._pipeline is not None
+        assert self._model is not None and self._tokenizer is not None
 
-        result = self._pipeline(
-            prompt,
+        input_ids = self._encode(prompt)
+        output = self._generate_with_prefix_cache(
+            input_ids,
             max_new_tokens=max_tokens,
             temperature=temperature,
-            do_sample=True,
-        )[0]["generated_text"]
+        )
+        # Decode only the new tokens; the prompt is never round-tripped
+        return self._tokenizer.decode(output[0, input_ids.shape[1]:], skip_special_tokens=True).strip()
+
+    def generate_stream(self, prompt: str, temperature: float, max_tokens: int) -> Iterator[str]:
+        """Yield decoded text as tokens are generated (prompt excluded)."""
+        from transformers import TextIteratorStreamer
+
+        self._lazy_init()
+        assert self._model is not None and self._tokenizer is not None
+
+        streamer = TextIteratorStreamer(
+            self._tokenizer,
+            skip_prompt=True,
+            skip_special_tokens=True,
+        )
+        input_ids = self._encode(prompt)
+        errors: List[BaseException] = []
+
+        def run() -> None:
+            try:
+                self._generate_with_prefix_cache(
+                    input_ids,
+                    max_new_tokens=max_tokens,
+                    temperature=temperature,
+                    streamer=streamer,
+                )
+            except BaseException as exc:
+                # Unblock the consumer; the error is re-raised on its side
+                errors.append(exc)
+                streamer.end()
+
+        worker = Thread(target=run, daemon=True)
+        worker.start()
+        try:
+            for chunk in streamer:
+                if chunk:
+                    yield chunk
+        finally:
+            worker.join()
+        if errors:
+            raise errors[0]
+
+    def generate_batch(self, requests: Sequence[Tuple[str, float, int]]) -> List[str]:
+        """Run prompts sharing the same sampling parameters through one padded ``generate`` call."""
+        self._lazy_init()
+        assert self._model is not None and self._tokenizer is not None
+
+        groups: Dict[Tuple[float, int], List[int]] = {}
+        for idx, (_, temperature, max_tokens) in enumerate(requests):
+            groups.setdefault((temperature, max_tokens), []).append(idx)
 
-        if result.startswith(prompt):
-            return result[len(prompt):].strip()
-        return result.strip()
+        results: List[str] = [""] * len(requests)
+        for (temperature, max_tokens), indices in groups.items():
+            encoded = self._tokenizer(
+                [requests[i][0] for i in indices],
+                return_tensors="pt",
+                padding=True,
+            ).to(self._model.device)
+            output = self._model.generate(
+                **encoded,
+                max_new_tokens=max_tokens,
+                temperature=temperature,
+            )
+            texts = self._tokenizer.batch_decode(
+                output[:, encoded["input_ids"].shape[1]:],
+                skip_special_tokens=True,
+            )
+            for i, text in zip(indices, texts):
+                results[i] = text.strip()
+        return results
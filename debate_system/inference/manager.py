@@ -1,15 +1,24 @@
 """Model manager singleton and helper functions."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
-from typing import Optional, Protocol
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Protocol, Sequence, Tuple
 
 from ..core.config import ModelConfig
+from ..utils.http import POOL_MAXSIZE
 from .backends import OllamaBackend, TransformersBackend
 
 logger = logging.getLogger(__name__)
 
 
+GenerationRequest = Tuple[str, float, int]
+
+
 class ModelBackend(Protocol):
     def generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
         ...
@@ -31,25 +40,144 @@ class ModelManager:
             return
         self.backend: Optional[ModelBackend] = None
         self.config: Optional[ModelConfig] = None
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._init_lock = threading.Lock()
         self._initialized = True
 
     def initialize(self, config: ModelConfig) -> None:
-        self.config = config
-        backend_name = config.backend.lower()
-
-        if backend_name == "ollama":
-            self.backend = OllamaBackend(config)
-        elif backend_name == "transformers":
-            self.backend = TransformersBackend(config)
-        else:
-            raise ValueError(f"Unsupported backend: {config.backend}")
-
+        with self._init_lock:
+            if self.backend is not None and self.config == config:
+                # Same settings: keep the loaded backend (and its model) as is
+                return
+            backend_name = config.backend.lower()
+
+            if backend_name == "ollama":
+                backend: ModelBackend = OllamaBackend(config)
+            elif backend_name == "transformers":
+                backend = TransformersBackend(config)
+            else:
+                raise ValueError(f"Unsupported backend: {config.backend}")
+
+            self.config = config
+            self.backend = backend
+            self.clear_cache()
         logger.info(f"Initialized model backend: {backend_name}")
 
+    def clear_cache(self) -> None:
+        """Drop all cached responses and reset the hit/miss counters."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
+
+    def _cache_key(self, prompt: str, temperature: float, max_tokens: int) -> Optional[str]:
+        """Return the cache key for a request, or None if it must not be cached.
+
+        Sampled replies are only cached when ``cache_sampled`` is set, since
+        replaying them would hide the variation the temperature asks for.
+        """
+        if self.config is None or self.config.cache_size <= 0:
+            return None
+        if temperature > 0.0 and not self.config.cache_sampled:
+            return None
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+        return f"{digest}:{temperature:.2f}:{max_tokens}"
+
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        if key is None:
+            return None
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is None:
+                self._cache_misses += 1
+            else:
+                self._cache.move_to_end(key)
+                self._cache_hits += 1
+            hits, misses = self._cache_hits, self._cache_misses
+        logger.debug(f"Response cache {'hit' if cached is not None else 'miss'} (hits={hits}, misses={misses})")
+        return cached
+
+    def _cache_put(self, key: Optional[str], response: str) -> None:
+        if key is None or self.config is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = response
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.config.cache_size:
+                self._cache.popitem(last=False)
+
     def generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
         if not self.backend:
             raise RuntimeError("Model backend not initialized")
-        return self.backend.generate(prompt, temperature, max_tokens)
+        key = self._cache_key(prompt, temperature, max_tokens)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        response = self.backend.generate(prompt, temperature, max_tokens)
+        self._cache_put(key, response)
+        return response
+
+    def generate_stream(self, prompt: str, temperature: float, max_tokens: int) -> Iterator[str]:
+        """Yield text chunks as they are produced.
+
+        Backends without ``generate_stream`` yield the full completion once.
+        """
+        if not self.backend:
+            raise RuntimeError("Model backend not initialized")
+        key = self._cache_key(prompt, temperature, max_tokens)
+        cached = self._cache_get(key)
+        if cached is not None:
+            yield cached
+            return
+        stream = getattr(self.backend, "generate_stream", None)
+        if stream is None:
+            response = self.backend.generate(prompt, temperature, max_tokens)
+            self._cache_put(key, response)
+            yield response
+            return
+        chunks: List[str] = []
+        for chunk in stream(prompt, temperature, max_tokens):
+            chunks.append(chunk)
+            yield chunk
+        # Only a fully consumed stream is a complete response worth caching
+        self._cache_put(key, "".join(chunks))
+
+    def generate_batch(self, requests: Sequence[GenerationRequest]) -> List[str]:
+        """Generate completions for several ``(prompt, temperature, max_tokens)`` requests.
+
+        Cached requests are answered directly. Of the rest, backends exposing
+        ``generate_batch`` receive the whole list in one call; others
+        (network-bound, e.g. Ollama) are fanned out over a thread pool.
+        """
+        if not self.backend:
+            raise RuntimeError("Model backend not initialized")
+        results: List[Optional[str]] = [None] * len(requests)
+        keys: Dict[int, Optional[str]] = {}
+        for idx, request in enumerate(requests):
+            key = self._cache_key(*request)
+            results[idx] = self._cache_get(key)
+            if results[idx] is None:
+                keys[idx] = key
+        pending = [requests[idx] for idx in keys]
+        if pending:
+            for idx, response in zip(keys, self._generate_uncached_batch(pending)):
+                results[idx] = response
+                self._cache_put(keys[idx], response)
+        return results  # type: ignore[return-value]
+
+    def _generate_uncached_batch(self, requests: Sequence[GenerationRequest]) -> List[str]:
+        batch = getattr(self.backend, "generate_batch", None)
+        if batch is not None:
+            return batch(list(requests))
+        if len(requests) <= 1:
+            return [self.backend.generate(*request) for request in requests]
+        # Stay within the HTTP pool so no worker waits on a connection
+        workers = min(len(requests), POOL_MAXSIZE)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="debate-gen") as pool:
+            return list(pool.map(lambda request: self.backend.generate(*request), requests))
 
 
 def get_model_manager() -> ModelManager:
@@ -64,3 +192,18 @@ def initialize_model(config: ModelConfig) -> None:
 def generate_text(prompt: str, temperature: float = 0.8, max_new_tokens: int = 256) -> str:
     manager = get_model_manager()
     return manager.generate(prompt, temperature, max_new_tokens)
+
+
+def generate_text_stream(prompt: str, temperature: float = 0.8, max_new_tokens: int = 256) -> Iterator[str]:
+    manager = get_model_manager()
+    return manager.generate_stream(prompt, temperature, max_new_tokens)
+
+
+def generate_text_batch(requests: Sequence[GenerationRequest]) -> List[str]:
+    manager = get_model_manager()
+    return manager.generate_batch(requests)
+
+
+async def agenerate_text(prompt: str, temperature: float = 0.8, max_new_tokens: int = 256) -> str:
+    """Awaitable ``generate_text``; the blocking backend call runs in a worker thread."""
+    return await asyncio.to_thread(generate_text, prompt, temperature, max_new_tokens)
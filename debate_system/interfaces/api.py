@@ -1,12 +1,25 @@
 """Programmatic API for the debate system."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from ..core import build_orchestrator, ConfigManager
 from ..utils.logger import setup_logging
 
 
+@lru_cache(maxsize=4)
+def _load_config(settings_path: str, personas_path: str, tools_path: str) -> ConfigManager:
+    """Parse the config files and set up logging once per set of config paths."""
+    config_manager = ConfigManager(
+        settings_path=settings_path,
+        personas_path=personas_path,
+        tools_path=tools_path,
+    )
+    setup_logging(config_manager.get_logging_config())
+    return config_manager
+
+
 class DebateAPI:
     """Convenient wrapper for running debates programmatically."""
 
@@ -16,12 +29,8 @@ class DebateAPI:
         personas_path: str = "configs/personas.yaml",
         tools_path: str = "configs/tools.yaml",
     ) -> None:
-        self.config_manager = ConfigManager(
-            settings_path=settings_path,
-            personas_path=personas_path,
-            tools_path=tools_path,
-        )
-        setup_logging(self.config_manager.get_logging_config())
+        self.config_manager = _load_config(settings_path, personas_path, tools_path)
+        # Memory is per instance; the model backend is initialised once and shared
         self.orchestrator = build_orchestrator(config_manager=self.config_manager)
 
     def ask(self, question: str, rounds: Optional[int] = None, enable_summary: Optional[bool] = None) -> Dict[str, Any]:
@@ -4,15 +4,20 @@ from __future__ import annotations
 import argparse
 from typing import Dict
 
-from colorama import Fore, Style, init
-
 from ..core import build_orchestrator, ConfigManager
 from ..utils.logger import setup_logging
 
-init(autoreset=True)
+# colorama ``Fore`` attribute names; colorama itself is imported on first display
+_COLOR_BY_SPEAKER = {
+    "plato": "GREEN",
+    "aristotle": "YELLOW",
+    "summary": "MAGENTA",
+}
 
 
 def _display_result(result: Dict[str, object]) -> None:
+    from colorama import Fore, Style
+
     if result.get("error"):
         print(f"{Fore.RED}Error: {result['error']}{Style.RESET_ALL}")
         return
@@ -21,13 +26,7 @@ def _display_result(result: Dict[str, object]) -> None:
     for entry in result.get("history", []):
         speaker = entry.get("speaker", "Agent")
         content = entry.get("content", "")
-        color = Fore.CYAN
-        if str(speaker).lower() == "plato":
-            color = Fore.GREEN
-        elif str(speaker).lower() == "aristotle":
-            color = Fore.YELLOW
-        elif str(speaker).lower() == "summary":
-            color = Fore.MAGENTA
+        color = getattr(Fore, _COLOR_BY_SPEAKER.get(str(speaker).lower(), "CYAN"))
         print(f"{color}[{speaker}]{Style.RESET_ALL}\n{content}\n")
 
     summary = result.get("summary")
@@ -36,6 +35,9 @@ def _display_result(result: Dict[str, object]) -> None:
 
 
 def main() -> None:
+    from colorama import init
+
+    init(autoreset=True)
     parser = argparse.ArgumentParser(description="Multi-agent philosophical debate")
     parser.add_argument("question", nargs="?", help="Question to debate")
     parser.add_argument("-r", "--rounds", type=int, default=None, help="Number of rounds")
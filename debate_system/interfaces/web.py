@@ -9,11 +9,28 @@ from debate_system.core import build_orchestrator, ConfigManager
 from debate_system.utils.logger import setup_logging
 
 
+@st.cache_resource
+def _load_config(
+    settings_path: str = "configs/settings.yaml",
+    personas_path: str = "configs/personas.yaml",
+    tools_path: str = "configs/tools.yaml",
+) -> ConfigManager:
+    """Parse the config files and set up logging once per process."""
+    config_manager = ConfigManager(
+        settings_path=settings_path,
+        personas_path=personas_path,
+        tools_path=tools_path,
+    )
+    setup_logging(config_manager.get_logging_config())
+    return config_manager
+
+
 def _init_state() -> None:
     if "orchestrator" not in st.session_state:
-        config_manager = ConfigManager()
-        setup_logging(config_manager.get_logging_config())
+        config_manager = _load_config()
         st.session_state.config_manager = config_manager
+        # Each session gets its own orchestrator and memory; the model
+        # backend behind them is initialised once and shared.
         st.session_state.orchestrator = build_orchestrator(config_manager=config_manager)
         st.session_state.memory = st.session_state.orchestrator.memory
 
@@ -30,20 +47,40 @@ def _format_transcript(result: dict) -> str:
     return "\n".join(lines)
 
 
+def _transcript_for(result: dict) -> str:
+    """Return the transcript for ``result``, rebuilt only when the result changes."""
+    # Holding the result itself (not just its id) keeps the identity check sound
+    cached = st.session_state.get("transcript_cache")
+    if cached is None or cached[0] is not result:
+        cached = (result, _format_transcript(result))
+        st.session_state.transcript_cache = cached
+    return cached[1]
+
+
+_AVATAR_BY_SPEAKER = {
+    "user": "🧑",
+    "socrates": "assets/socrates.png",
+    "plato": "assets/plato.png",
+    "aristotle": "assets/aristotle.png",
+    "summary": "📝",
+}
+
+
 def _get_avatar(speaker: str) -> str:
-    speaker_l = str(speaker).lower()
-    if speaker_l == "user":
-        return "🧑"
-    elif speaker_l == "socrates":
-        return "assets/socrates.png"
-    elif speaker_l == "plato":
-        return "assets/plato.png"
-    elif speaker_l == "aristotle":
-        return "assets/aristotle.png"
-    elif speaker_l == "summary":
-        return "📝"
-    else:
-        return "🤖"
+    return _AVATAR_BY_SPEAKER.get(str(speaker).lower(), "🤖")
+
+
+# Redraw an in-progress turn only after it has grown by this many characters
+_PARTIAL_REDRAW_CHARS = 40
+
+
+def _render_entry(slot, entry: dict) -> None:
+    """Draw one debate turn into ``slot``, replacing whatever it showed before."""
+    speaker = str(entry.get("speaker", "Agent"))
+    with slot.container():
+        with st.chat_message(name=speaker, avatar=_get_avatar(speaker)):
+            content = entry.get("content", "")
+            st.markdown(content.replace("\n", "  \n"))
 
 
 def main() -> None:
@@ -88,33 +125,47 @@ def main() -> None:
                     question=question,
                     rounds=rounds,
                     enable_summary=enable_summary,
+                    stream_tokens=True,
                 )
                 
+                # One placeholder per history index; slot i is written when entry i
+                # finishes and never touched again. The extra trailing slot shows
+                # the turn currently being generated.
+                placeholders = []
                 rendered_count = 0
+                drawn_partial = 0
                 result = {}
                 for result in stream:
                     history = result.get("history", [])
                     for i in range(rendered_count, len(history)):
-                        entry = history[i]
-                        speaker = str(entry.get("speaker", "Agent"))
-                        avatar = _get_avatar(speaker)
-                        with debate_placeholder:
-                            with st.chat_message(name=speaker, avatar=avatar):
-                                content = entry.get("content", "")
-                                st.markdown(content.replace("\n", "  \n"))
-                    rendered_count = len(history)
-
+                        if i == len(placeholders):
+                            placeholders.append(debate_placeholder.empty())
+                        _render_entry(placeholders[i], history[i])
+                    if len(history) > rendered_count:
+                        rendered_count = len(history)
+                        drawn_partial = 0
+
+                    partial = result.get("partial")
+                    if partial and len(partial.get("content", "")) - drawn_partial >= _PARTIAL_REDRAW_CHARS:
+                        if len(placeholders) == rendered_count:
+                            placeholders.append(debate_placeholder.empty())
+                        _render_entry(placeholders[rendered_count], partial)
+                        drawn_partial = len(partial["content"])
+
+            st.session_state.last_result = result
             if result.get("error"):
                 st.error(f"Error: {result['error']}")
-            else:
-                transcript = _format_transcript(result)
-                st.download_button(
-                    label="Download transcript",
-                    data=transcript,
-                    file_name="debate_transcript.txt",
-                    mime="text/plain",
-                    use_container_width=True
-                )
+
+    # Offered on every rerun (e.g. after a widget change) until the next debate
+    last_result = st.session_state.get("last_result")
+    if last_result and not last_result.get("error"):
+        st.download_button(
+            label="Download transcript",
+            data=_transcript_for(last_result),
+            file_name="debate_transcript.txt",
+            mime="text/plain",
+            use_container_width=True
+        )
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,32 @@
+"""Shared HTTP session setup."""
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Sized to cover the per-round agent fan-out plus concurrent tool calls
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 32
+# Connect errors and 502/503/504 are retried; read timeouts are not, so a
+# slow server surfaces as requests.Timeout instead of another full wait.
+MAX_RETRIES = 2
+
+
+def build_session() -> requests.Session:
+    """Return a keep-alive session with pooled connections and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=MAX_RETRIES,
+            read=False,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
@@ -1,33 +1,79 @@
 """Logging utilities for the debate system."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 from logging import Logger
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 from pathlib import Path
 
 from ..core.config import LoggingConfig
 
+LOG_FORMAT = "%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+
+# Handlers installed by the last ``setup_logging`` call, replaced on the next one
+_installed_handlers: List[logging.Handler] = []
+_file_listener: Optional[QueueListener] = None
+
 
 def setup_logging(config: LoggingConfig) -> Logger:
-    """Configure root logger based on settings."""
+    """Configure root logger based on settings.
+
+    Safe to call repeatedly: handlers from a previous call are replaced.
+    File output goes through a queue so disk writes happen on a listener
+    thread rather than the thread that logged.
+    """
+    global _file_listener
+
     level = getattr(logging, config.level.upper(), logging.INFO)
-    handlers = []
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = []
+
+    _reset_handlers()
 
     if config.console:
-        handlers.append(logging.StreamHandler())
+        console = logging.StreamHandler()
+        console.setFormatter(formatter)
+        handlers.append(console)
 
     if config.file:
         log_path = Path(config.file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        handlers.append(logging.FileHandler(log_path))
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setFormatter(formatter)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _file_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _file_listener.start()
+        handlers.append(QueueHandler(log_queue))
 
-    logging.basicConfig(
-        level=level,
-        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        handlers=handlers or None,
-    )
+    root = logging.getLogger()
+    root.setLevel(level)
+    for handler in handlers:
+        root.addHandler(handler)
+    _installed_handlers[:] = handlers
 
     logger = logging.getLogger("debate_system")
     logger.debug("Logging configured")
     return logger
+
+
+def _reset_handlers() -> None:
+    """Detach the handlers from the previous call and flush the file listener."""
+    global _file_listener
+
+    root = logging.getLogger()
+    for handler in _installed_handlers:
+        root.removeHandler(handler)
+        handler.close()
+    _installed_handlers.clear()
+
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_reset_handlers)
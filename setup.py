@@ -9,7 +9,7 @@ setup(
         "requests>=2.31.0",
         "streamlit>=1.28.0",
         "colorama>=0.4.6",
-        "transformers>=4.35.0",
+        "transformers>=4.38.0",
         "torch>=2.0.0",
         "accelerate>=0.24.0",
         "bitsandbytes>=0.41.0",
@@ -17,6 +17,7 @@ setup(
     ],
     extras_require={
         "dev": ["pytest>=7.4.0", "pytest-cov>=4.1.0", "pytest-mock>=3.12.0"],
+        "speedups": ["orjson>=3.9.0", "pyahocorasick>=2.0.0", "aiohttp>=3.9.0"],
     },
     python_requires=">=3.9",
     description="Modular multi-agent philosophical debate system",
@@ -1,5 +1,7 @@
 from debate_system.agents.aristotle import AristotleAgent
 from debate_system.core.config import AgentConfig
+from debate_system.core.history import History
+from debate_system.core.memory import MemoryStore
 
 
 def make_aristotle(tools_enabled: bool = True) -> AristotleAgent:
@@ -28,6 +30,11 @@ def test_aristotle_tool_detection_explain():
     assert agent._detect_tool_needed("Explain the theory of forms") == "web_search"
 
 
+def test_aristotle_tool_detection_none():
+    agent = make_aristotle()
+    assert agent._detect_tool_needed("Virtue is a habit") is None
+
+
 def test_aristotle_question_extraction():
     agent = make_aristotle()
     text = "I think we need to look up more info. What is justice?"
@@ -43,3 +50,62 @@ def test_aristotle_calculate_query_normalization():
     agent = make_aristotle()
     expr = agent._detect_tool_needed("Could you calculate 12 * 7 for me?")
     assert expr == "calculate"
+
+
+def test_aristotle_calculate_query_extracts_expression(monkeypatch):
+    calls = []
+
+    def fake_execute_tool(tool, query):
+        calls.append((tool, query))
+        return "Result: 84"
+
+    monkeypatch.setattr("debate_system.agents.aristotle.execute_tool", fake_execute_tool)
+    agent = make_aristotle()
+    prompt, used_tool = agent.prepare_prompt("Could you calculate 12 * 7 for me?", [])
+    assert used_tool
+    assert calls == [("calculate", "12 * 7")]
+    assert "Result: 84" in prompt
+
+
+def test_aristotle_skips_insight_for_tool_assisted_reply(monkeypatch):
+    monkeypatch.setattr("debate_system.agents.aristotle.execute_tool", lambda tool, query: "Result: 84")
+    agent = make_aristotle()
+    memory = MemoryStore(auto_save=False)
+    history = [{"speaker": "User", "content": "Calculate 12 * 7"}]
+
+    _, used_tool = agent.prepare_prompt("Calculate 12 * 7", history, memory)
+    agent.finalize_response("Aristotle: It is 84.", history, memory, used_tool)
+    assert memory.get_entry("tool_calculate_1") == "Result: 84"
+    assert memory.get_entry("aristotle_insight_1") is None
+
+    _, used_tool = agent.prepare_prompt("Virtue is a habit", history, memory)
+    assert not used_tool
+    agent.finalize_response("Aristotle: A mean between extremes.", history, memory, used_tool)
+    assert memory.get_entry("aristotle_insight_1") == "A mean between extremes."
+
+
+def test_format_history_matches_for_history_and_list():
+    agent = make_aristotle()
+    turns = [
+        {"speaker": "User", "content": "What is virtue?"},
+        {"speaker": "Plato", "content": "  "},
+        {"agent": "Socrates", "response": "Define it first."},
+    ]
+    history = History(turns[:1])
+    history.append(turns[1])
+    history.append(turns[2])
+    assert agent.format_history(history) == agent.format_history(turns)
+    assert agent.format_history(History()) == "(No prior conversation)"
+
+
+def test_stream_response_strips_split_speaker_prefix(monkeypatch):
+    chunks = [" Aris", "totle:", " Act", " well."]
+    monkeypatch.setattr(
+        "debate_system.agents.base.generate_text_stream",
+        lambda prompt, **params: iter(chunks),
+    )
+    agent = make_aristotle(tools_enabled=False)
+    partials = list(agent.stream_response("Virtue is a habit", []))
+    assert partials[0] == "Act"
+    assert partials[-1] == "Act well."
+    assert partials[-1] == agent.extract_response("".join(chunks))
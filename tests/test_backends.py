@@ -0,0 +1,184 @@
+import threading
+
+import pytest
+
+from debate_system.core.config import ModelConfig
+from debate_system.inference.backends import OllamaBackend, TransformersBackend
+from debate_system.inference.manager import ModelManager
+
+
+class FakeResponse:
+    def __init__(self, lines):
+        self._lines = lines
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_lines(self):
+        return iter(self._lines)
+
+
+class FakeSession:
+    def __init__(self, lines):
+        self.lines = lines
+        self.calls = []
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return FakeResponse(self.lines)
+
+
+@pytest.fixture(autouse=True)
+def offline_warm_up(monkeypatch):
+    # Constructing an OllamaBackend would otherwise POST to localhost:11434
+    monkeypatch.setattr(OllamaBackend, "_warm_up", lambda self, session: None)
+
+
+STREAMED = [
+    b'{"response": "Hel", "done": false}',
+    b"",
+    b'{"response": "lo", "done": false}',
+    b'{"response": "", "done": true}',
+]
+
+
+def test_ollama_generate_reuses_session():
+    backend = OllamaBackend(ModelConfig(backend="ollama", model_name="llama3"))
+    backend._session = FakeSession(STREAMED)
+
+    assert backend.generate("Hi", 0.5, 16) == "Hello"
+    assert backend.generate("Hi again", 0.5, 16) == "Hello"
+    assert len(backend._session.calls) == 2
+    assert backend._session.calls[0][0].endswith("/api/generate")
+
+
+def test_ollama_stream_yields_chunks():
+    backend = OllamaBackend(ModelConfig(backend="ollama", model_name="llama3"))
+    backend._session = FakeSession(STREAMED)
+
+    assert list(backend.generate_stream("Hi", 0.5, 16)) == ["Hel", "lo"]
+    _, kwargs = backend._session.calls[0]
+    assert kwargs["stream"] is True
+    assert kwargs["json"]["options"]["num_predict"] == 16
+
+
+def test_generate_batch_fans_out_without_backend_batch():
+    class SlowBackend:
+        def __init__(self):
+            self.barrier = threading.Barrier(3, timeout=5)
+
+        def generate(self, prompt, temperature, max_tokens):
+            # Only completes if all three prompts are in flight at once
+            self.barrier.wait()
+            return prompt.upper()
+
+    manager = ModelManager()
+    previous = manager.backend
+    manager.backend = SlowBackend()
+    try:
+        requests = [("a", 0.1, 8), ("b", 0.2, 8), ("c", 0.3, 8)]
+        assert manager.generate_batch(requests) == ["A", "B", "C"]
+    finally:
+        manager.backend = previous
+
+
+def test_manager_caches_deterministic_responses():
+    class CountingBackend:
+        calls = 0
+
+        def generate(self, prompt, temperature, max_tokens):
+            CountingBackend.calls += 1
+            return f"{prompt}-{CountingBackend.calls}"
+
+    manager = ModelManager()
+    previous = manager.backend, manager.config
+    manager.backend = CountingBackend()
+    manager.config = ModelConfig(backend="test", model_name="m", cache_size=2)
+    manager.clear_cache()
+    try:
+        assert manager.generate("q", 0.0, 8) == "q-1"
+        assert manager.generate("q", 0.0, 8) == "q-1"
+        # Sampled replies bypass the cache unless cache_sampled is set
+        assert manager.generate("q", 0.7, 8) == "q-2"
+        assert manager.generate("q", 0.7, 8) == "q-3"
+        assert manager.generate_batch([("q", 0.0, 8), ("r", 0.0, 8)]) == ["q-1", "r-4"]
+    finally:
+        manager.backend, manager.config = previous
+        manager.clear_cache()
+
+
+def test_transformers_stream_raises_generation_errors():
+    backend = TransformersBackend(ModelConfig(backend="transformers", model_name="m", device="-1"))
+    backend._model = object()
+    backend._tokenizer = object()
+    backend._encode = lambda prompt: prompt
+
+    def failing_generate(input_ids, **kwargs):
+        raise RuntimeError("out of memory")
+
+    backend._generate_with_prefix_cache = failing_generate
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        list(backend.generate_stream("Hi", 0.5, 16))
+
+
+def test_manager_initialize_keeps_backend_for_same_config():
+    manager = ModelManager()
+    previous = manager.backend, manager.config
+    try:
+        manager.initialize(ModelConfig(backend="ollama", model_name="llama3"))
+        backend = manager.backend
+        manager.initialize(ModelConfig(backend="ollama", model_name="llama3"))
+        assert manager.backend is backend
+        manager.initialize(ModelConfig(backend="ollama", model_name="mistral"))
+        assert manager.backend is not backend
+    finally:
+        manager.backend, manager.config = previous
+
+
+def test_transformers_loads_model_once_under_concurrency(monkeypatch):
+    import asyncio
+    import time
+
+    from debate_system.inference.manager import agenerate_text
+
+    class FakeIds:
+        shape = (1, 2)
+
+        def __getitem__(self, key):
+            return key
+
+    class FakeTokenizer:
+        def decode(self, tokens, skip_special_tokens=True):
+            return "reply"
+
+    backend = TransformersBackend(ModelConfig(backend="transformers", model_name="m", device="-1"))
+    loads = []
+
+    def slow_load():
+        loads.append(1)
+        time.sleep(0.05)
+        backend._tokenizer = FakeTokenizer()
+        backend._model = object()
+
+    monkeypatch.setattr(backend, "_load_model", slow_load)
+    monkeypatch.setattr(backend, "_encode", lambda prompt: FakeIds())
+    monkeypatch.setattr(backend, "_generate_with_prefix_cache", lambda input_ids, **kwargs: FakeIds())
+
+    async def run_all():
+        return await asyncio.gather(*(agenerate_text(f"turn {i}") for i in range(3)))
+
+    manager = ModelManager()
+    previous = manager.backend, manager.config
+    manager.backend, manager.config = backend, None
+    try:
+        assert asyncio.run(run_all()) == ["reply"] * 3
+        assert len(loads) == 1
+    finally:
+        manager.backend, manager.config = previous
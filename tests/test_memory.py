@@ -0,0 +1,121 @@
+import weakref
+
+from debate_system.core.memory import MemoryEntry, MemoryStore, _flush_at_exit
+
+
+def test_memory_evicts_oldest_entry():
+    store = MemoryStore(auto_save=False, max_entries=2)
+    store.add_entry("a", 1)
+    store.add_entry("b", 2)
+    store.add_entry("c", 3)
+    assert store.get_entry("a") is None
+    assert [e.key for e in store.get_recent()] == ["c", "b"]
+
+
+def test_memory_re_adding_key_refreshes_recency():
+    store = MemoryStore(auto_save=False, max_entries=2)
+    store.add_entry("a", 1)
+    store.add_entry("b", 2)
+    store.add_entry("a", 3)
+    store.add_entry("c", 4)
+    assert store.get_entry("b") is None
+    assert store.get_entry("a") == 3
+
+
+def test_memory_search_returns_newest_first():
+    store = MemoryStore(auto_save=False)
+    store.add_entry("first", "Plato on justice")
+    store.add_entry("second", "Aristotle on virtue")
+    store.add_entry("third", "Socrates on justice")
+    assert [e.key for e in store.search("justice")] == ["third", "first"]
+
+
+def test_memory_auto_save_is_batched(tmp_path):
+    path = tmp_path / "memory.json"
+    store = MemoryStore(persist_path=str(path), save_interval=3)
+    store.add_entry("a", 1)
+    store.add_entry("b", 2)
+    assert not path.exists()
+    store.add_entry("c", 3)
+    assert path.exists()
+
+    store.add_entry("d", 4)
+    store.flush()
+    assert MemoryStore(persist_path=str(path)).get_entry("d") == 4
+
+
+def test_memory_search_partial_word_and_eviction():
+    store = MemoryStore(auto_save=False, max_entries=2)
+    store.add_entry("a", "The allegory of the cave")
+    store.add_entry("b", "Golden mean")
+    assert [e.key for e in store.search("alleg")] == ["a"]
+    store.add_entry("c", "Another cave")
+    assert [e.key for e in store.search("cave")] == ["c"]
+    assert store.search("golden MEAN")[0].key == "b"
+
+
+def test_memory_jsonl_log_replays_and_compacts(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    store = MemoryStore(persist_path=str(path), save_interval=1, compact_every=4)
+    store.add_entry("a", 1)
+    store.add_entry("b", 2)
+    store.add_entry("a", 3)
+    assert len(path.read_bytes().splitlines()) == 3
+    assert MemoryStore(persist_path=str(path)).get_entry("a") == 3
+
+    store.add_entry("c", 4)
+    assert len(path.read_bytes().splitlines()) == 3
+    reloaded = MemoryStore(persist_path=str(path))
+    assert [e.key for e in reloaded.get_recent()] == ["c", "a", "b"]
+
+
+def test_memory_jsonl_migrates_legacy_json(tmp_path):
+    legacy = MemoryStore(persist_path=str(tmp_path / "memory.json"))
+    legacy.add_entry("old", "value")
+    legacy.flush()
+
+    store = MemoryStore(persist_path=str(tmp_path / "memory.jsonl"))
+    assert store.get_entry("old") == "value"
+    store.flush()
+    assert (tmp_path / "memory.jsonl").exists()
+
+
+def test_memory_entry_reads_legacy_iso_timestamp():
+    entry = MemoryEntry.from_dict(
+        {"key": "k", "value": "v", "timestamp": "2024-05-01T12:30:45.123456", "source": "user"}
+    )
+    assert isinstance(entry.timestamp, int)
+    assert entry.timestamp_iso == "2024-05-01T12:30:45.123456"
+
+
+def test_memory_search_matches_substrings_of_indexed_tokens():
+    store = MemoryStore(auto_save=False)
+    store.add_entry("tool_web_search_3", "Forms are eternal")
+    store.add_entry("note", "a tool for thought")
+    assert [e.key for e in store.search("tool")] == ["note", "tool_web_search_3"]
+    assert [e.key for e in store.search("web_sea")] == ["tool_web_search_3"]
+
+
+def test_memory_exit_hook_respects_auto_save(tmp_path):
+    manual = MemoryStore(persist_path=str(tmp_path / "manual.json"), auto_save=False)
+    manual.add_entry("a", 1)
+    _flush_at_exit(weakref.ref(manual))
+    assert not (tmp_path / "manual.json").exists()
+
+    auto = MemoryStore(persist_path=str(tmp_path / "auto.json"))
+    auto.add_entry("a", 1)
+    _flush_at_exit(weakref.ref(auto))
+    assert (tmp_path / "auto.json").exists()
+
+
+def test_memory_jsonl_skips_unserializable_values(tmp_path):
+    path = tmp_path / "memory.jsonl"
+    store = MemoryStore(persist_path=str(path), save_interval=1)
+    store.add_entry("bad", {1, 2})
+    store.add_entry("good", "ok")
+    assert store.get_entry("bad") == {1, 2}
+    assert [e.key for e in store.search("ok")] == ["good"]
+
+    reloaded = MemoryStore(persist_path=str(path))
+    assert reloaded.get_entry("good") == "ok"
+    assert reloaded.get_entry("bad") is None
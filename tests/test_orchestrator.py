@@ -0,0 +1,117 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from debate_system.core.config import ConfigManager, OrchestratorConfig
+from debate_system.core.memory import MemoryStore
+from debate_system.core.orchestrator import DebateOrchestrator
+from debate_system.inference.manager import ModelManager
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+class FakeBackend:
+    def __init__(self):
+        self.generate_calls = 0
+        self.batch_calls = 0
+        self.fail_batch = False
+
+    def generate(self, prompt, temperature, max_tokens):
+        self.generate_calls += 1
+        return f"reply {self.generate_calls}"
+
+    def generate_stream(self, prompt, temperature, max_tokens):
+        self.generate_calls += 1
+        for word in ("streamed ", "reply ", "text"):
+            yield word
+
+    def generate_batch(self, requests):
+        self.batch_calls += 1
+        if self.fail_batch:
+            raise RuntimeError("batch failed")
+        return [f"batched {i}" for i in range(len(requests))]
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    fake = FakeBackend()
+    manager = ModelManager()
+    previous = manager.backend, manager.config
+    monkeypatch.setattr("debate_system.core.orchestrator.initialize_model", lambda config: None)
+    # Keep Aristotle's tool lookups offline
+    monkeypatch.setattr("debate_system.agents.aristotle.execute_tool", lambda *args: "tool result")
+
+    async def fake_aexecute_tool(*args):
+        return "tool result"
+
+    monkeypatch.setattr("debate_system.agents.aristotle.aexecute_tool", fake_aexecute_tool)
+    manager.backend, manager.config = fake, None
+    yield fake
+    manager.backend, manager.config = previous
+
+
+def make_orchestrator(**overrides):
+    config = OrchestratorConfig(default_rounds=1, random_order=False, max_retries=1, **overrides)
+    return DebateOrchestrator(
+        ConfigManager(base_path=str(REPO_ROOT)),
+        memory_store=MemoryStore(auto_save=False),
+        orchestrator_config=config,
+    )
+
+
+def speakers(result):
+    return [entry["speaker"] for entry in result["history"]]
+
+
+def test_run_debate_is_sequential_by_default(backend):
+    result = make_orchestrator().run_debate("What is virtue?")
+    assert result["status"] == "completed"
+    assert speakers(result) == ["User", "Socrates", "Plato", "Aristotle", "Summary"]
+    assert backend.batch_calls == 0
+
+
+def test_parallel_agents_batches_rounds_from_run_debate(backend):
+    result = make_orchestrator(parallel_agents=True).run_debate("What is virtue?", enable_summary=False)
+    assert backend.batch_calls == 1
+    assert [entry["content"] for entry in result["history"][1:]] == ["batched 0", "batched 1", "batched 2"]
+
+
+def test_batched_round_falls_back_to_per_agent_calls(backend, monkeypatch):
+    tool_calls = []
+
+    def fake_execute_tool(*args):
+        tool_calls.append(args)
+        return "tool result"
+
+    monkeypatch.setattr("debate_system.agents.aristotle.execute_tool", fake_execute_tool)
+    backend.fail_batch = True
+    orchestrator = make_orchestrator(parallel_agents=True)
+    result = orchestrator.run_debate("How do we find virtue?", enable_summary=False)
+    assert backend.batch_calls == 1
+    assert [entry["content"] for entry in result["history"][1:]] == ["reply 1", "reply 2", "reply 3"]
+    # The fallback reuses the round's prompts instead of re-running the tool
+    assert len(tool_calls) == 1
+
+
+def test_stream_tokens_yields_partials_before_each_turn(backend):
+    orchestrator = make_orchestrator()
+    results = list(orchestrator.stream_debate("What is virtue?", stream_tokens=True))
+    partials = [r["partial"] for r in results if r["status"] == "streaming"]
+    assert list(dict.fromkeys(p["speaker"] for p in partials)) == ["Socrates", "Plato", "Aristotle", "Summary"]
+    assert partials[-1]["content"] == "streamed reply text"
+    assert "partial" not in results[-1]
+    assert speakers(results[-1]) == ["User", "Socrates", "Plato", "Aristotle", "Summary"]
+
+
+def test_astream_debate_gathers_each_round(backend):
+    async def run():
+        orchestrator = make_orchestrator(max_concurrency=2)
+        return [result async for result in orchestrator.astream_debate("What is virtue?", rounds=2)]
+
+    results = asyncio.run(run())
+    assert [r["status"] for r in results] == ["started", "debating", "debating", "completed"]
+    rounds = [entry.get("round") for entry in results[-1]["history"]]
+    assert rounds == [None, 1, 1, 1, 2, 2, 2, None]
+    assert speakers(results[-1])[-1] == "Summary"
+    assert backend.batch_calls == 0
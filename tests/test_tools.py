@@ -1,4 +1,9 @@
-from debate_system.core.tools import calculate, get_current_info, web_search
+import asyncio
+
+import pytest
+
+from debate_system.core import tools
+from debate_system.core.tools import aexecute_tool, calculate, get_current_info, web_search
 
 
 def test_calculate_simple():
@@ -9,6 +14,13 @@ def test_calculate_rejects_invalid():
     assert "Error" in calculate("import os")
 
 
+def test_calculate_caps_exponent():
+    assert calculate("2 ** 10") == "Result: 1024"
+    assert "Exponent too large" in calculate("9 ** 9 ** 9")
+    assert calculate("9 ** 1000").startswith("Result: ")
+    assert "Result too large" in calculate("((9 ** 999) ** 999) ** 999")
+
+
 def test_get_current_info_formats():
     date_str = get_current_info("date")
     assert len(date_str) == 10
@@ -18,3 +30,138 @@ def test_web_search_returns_list():
     results = web_search("philosophy")
     assert isinstance(results, list)
     assert len(results) >= 1
+
+
+def test_aexecute_tool_matches_sync():
+    assert asyncio.run(aexecute_tool("calculate", "6 * 7")) == calculate("6 * 7")
+
+
+def test_aexecute_tool_prefers_async_variant(monkeypatch):
+    async def fake_search(query):
+        return [f"async:{query}"]
+
+    monkeypatch.setitem(tools.ASYNC_TOOL_REGISTRY, "web_search", fake_search)
+    assert asyncio.run(aexecute_tool("web_search", "logos")) == ["async:logos"]
+
+
+def test_web_search_caches_hits_and_misses(monkeypatch):
+    class FakeResponse:
+        def __init__(self, content):
+            self.content = content
+
+        def raise_for_status(self):
+            pass
+
+    class FakeSession:
+        calls = 0
+
+        def get(self, url, params=None, timeout=None):
+            FakeSession.calls += 1
+            if params["q"] == "virtue":
+                return FakeResponse(b'{"Abstract": "Excellence"}')
+            return FakeResponse(b"{}")
+
+    monkeypatch.setattr(tools, "_SESSION", FakeSession())
+    tools.clear_search_cache()
+    try:
+        assert web_search("virtue") == ["Summary: Excellence"]
+        assert web_search("Virtue ") == ["Summary: Excellence"]
+        assert web_search("what is the good life") == ["No results found"]
+        assert web_search("What is the good life") == ["No results found"]
+        assert FakeSession.calls == 2
+    finally:
+        tools.clear_search_cache()
+
+
+def test_web_search_uses_full_timeout_for_reads(monkeypatch):
+    import http.server
+    import threading
+    import time
+
+    class SlowHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            # "steady" answers within the timeout but after a third of it
+            time.sleep(0.4 if "steady" in self.path else 2)
+            self.send_response(200)
+            self.end_headers()
+            self.wfile.write(b'{"Abstract": "Answered"}')
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(tools, "_SEARCH_URL", f"http://127.0.0.1:{server.server_port}/")
+    tools.clear_search_cache()
+    try:
+        assert web_search("steady", timeout=0.8) == ["Summary: Answered"]
+        start = time.monotonic()
+        assert web_search("slow", timeout=0.8) == ["Search timed out after 0.8 seconds"]
+        assert 0.7 < time.monotonic() - start < 1.5
+    finally:
+        server.shutdown()
+        server.server_close()
+        tools.clear_search_cache()
+
+
+def test_aexecute_tool_bounds_async_concurrency(monkeypatch):
+    active = peak = 0
+
+    async def fake_search(query):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return [query]
+
+    async def run_all():
+        calls = [aexecute_tool("web_search", str(i)) for i in range(tools.MAX_CONCURRENT_TOOLS * 3)]
+        return await asyncio.gather(*calls)
+
+    monkeypatch.setitem(tools.ASYNC_TOOL_REGISTRY, "web_search", fake_search)
+    assert len(asyncio.run(run_all())) == tools.MAX_CONCURRENT_TOOLS * 3
+    assert asyncio.run(aexecute_tool("web_search", "again")) == ["again"]
+    assert peak == tools.MAX_CONCURRENT_TOOLS
+
+
+@pytest.mark.skipif(tools.aiohttp is None, reason="aiohttp not installed")
+def test_web_search_async_reuses_session_per_loop(monkeypatch):
+    import http.server
+    import threading
+
+    clients = set()
+
+    class JsonHandler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            clients.add(self.client_address)
+            body = b'{"Abstract": "Answered"}'
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    async def search_twice():
+        assert await tools.web_search_async("first") == ["Summary: Answered"]
+        assert await tools.web_search_async("second") == ["Summary: Answered"]
+        session, _ = tools._AIOHTTP_SESSIONS[asyncio.get_running_loop()]
+        return session
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), JsonHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(tools, "_SEARCH_URL", f"http://127.0.0.1:{server.server_port}/")
+    tools.clear_search_cache()
+    try:
+        session = asyncio.run(search_twice())
+        # Both searches shared one keep-alive connection, closed with the loop
+        assert len(clients) == 1
+        assert session.closed
+    finally:
+        server.shutdown()
+        server.server_close()
+        tools.clear_search_cache()